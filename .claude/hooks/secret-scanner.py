@@ -35,7 +35,7 @@ SECRET_PATTERNS = [
     (r"sk_live_[0-9a-zA-Z]{24}", "Stripe API key"),
     (r"AIza[0-9A-Za-z_-]{35}", "Google API key"),
     (r"-----BEGIN\s+(RSA|DSA|EC|OPENSSH|PGP)?\s*PRIVATE KEY-----", "Private key header"),
-    (r"(?i)(mongodb|postgres|mysql|redis|amqp):\/\/[^\s]+:[^\s]+@", "Connection string"),
+    (r"(?i)(mongodb|postgres|mysql|redis|amqp):\/\/[^\s]{1,256}:[^\s]{1,256}@", "Connection string"),
     (r"(?i)bearer\s+[A-Za-z0-9_\-\.]{20,}", "Bearer token"),
     (r"eyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*", "JWT token"),
 ]
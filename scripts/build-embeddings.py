@@ -31,6 +31,12 @@ try:
 except ImportError:
     HAS_TRANSFORMERS = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # Folders to skip
 SKIP_DIRS = {
     ".git", ".obsidian", ".claude", ".mekb", ".graph",
@@ -43,6 +49,9 @@ SKIP_FILES = {".DS_Store", "Thumbs.db"}
 # Default embedding model (small, fast, good quality)
 DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
+# Vectors are stored as float16 rows of this file, next to embeddings.json
+MATRIX_FILE = "embeddings.npy"
+
 # Frontmatter regex
 FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
@@ -86,6 +95,10 @@ def parse_frontmatter(content):
 
 def find_vault_root():
     """Find the vault root by looking for .mekb/ or CLAUDE.md."""
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
     path = Path.cwd()
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
@@ -135,15 +148,72 @@ def prepare_text(title, note_type, tags, body):
 
 
 def load_existing(embeddings_path):
-    """Load existing embeddings file."""
+    """Load existing embeddings file.
+
+    Vectors stored in the .npy matrix are put back on each entry as
+    "vector"; entries whose row can't be read are dropped so they are
+    embedded again.
+    """
     if not embeddings_path.exists():
         return {"model": None, "embeddings": {}}
     try:
         with open(embeddings_path, "r") as f:
-            return json.load(f)
+            data = json.load(f)
     except (json.JSONDecodeError, IOError):
         return {"model": None, "embeddings": {}}
 
+    if data.get("matrix"):
+        embeddings = data.get("embeddings", {})
+        try:
+            matrix = np.load(embeddings_path.parent / data["matrix"]) if HAS_NUMPY else None
+        except (OSError, ValueError):
+            matrix = None
+        for rel_path, entry in list(embeddings.items()):
+            row = entry.pop("row", None)
+            if matrix is not None and isinstance(row, int) and 0 <= row < len(matrix):
+                entry["vector"] = matrix[row]
+            else:
+                del embeddings[rel_path]
+    return data
+
+
+def save_embeddings(embeddings_path, output):
+    """Write embeddings.json, with the vectors as a float16 matrix beside it.
+
+    Each entry records its "row" in the matrix instead of an inline vector,
+    so search.py loads the vectors without parsing them from JSON. Rows are
+    scaled to unit length (marked "normalized"), so search only has to
+    normalise the query. The matrix is written first: a reader that sees
+    the new JSON also sees the matrix it indexes.
+    """
+    embeddings = output["embeddings"]
+    paths = [path for path, entry in embeddings.items() if len(entry.get("vector", ()))]
+    matrix = np.asarray([embeddings[path]["vector"] for path in paths], dtype=np.float32)
+    if not paths:
+        matrix = matrix.reshape(0, output["dimension"])
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    matrix = (matrix / norms).astype(np.float16)
+
+    stored = {}
+    for path, entry in embeddings.items():
+        entry = {key: value for key, value in entry.items() if key != "vector"}
+        stored[path] = entry
+    for row, path in enumerate(paths):
+        stored[path]["row"] = row
+
+    embeddings_path.parent.mkdir(exist_ok=True)
+    matrix_path = embeddings_path.parent / MATRIX_FILE
+    tmp = matrix_path.with_suffix(".npy.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, matrix)
+    os.replace(tmp, matrix_path)
+
+    tmp = embeddings_path.with_suffix(".json.tmp")
+    with open(tmp, "w") as f:
+        json.dump({**output, "matrix": MATRIX_FILE, "normalized": True, "embeddings": stored}, f)
+    os.replace(tmp, embeddings_path)
+
 
 def build_embeddings(vault_root, model_name=None, rebuild=False, verbose=False):
     """Build or update vector embeddings for all notes."""
@@ -209,7 +279,7 @@ def build_embeddings(vault_root, model_name=None, rebuild=False, verbose=False):
             "title": title,
             "type": note_type,
             "mtime": mtime,
-            "vector": vectors[i].tolist(),
+            "vector": vectors[i],
         }
         if verbose:
             print(f"  Embedded: {rel_path}")
@@ -231,12 +301,11 @@ def build_embeddings(vault_root, model_name=None, rebuild=False, verbose=False):
         "embeddings": existing,
     }
 
-    embeddings_path.parent.mkdir(exist_ok=True)
-    with open(embeddings_path, "w") as f:
-        json.dump(output, f)
+    save_embeddings(embeddings_path, output)
 
+    size = embeddings_path.stat().st_size + (embeddings_path.parent / MATRIX_FILE).stat().st_size
     print(f"Embedded {len(texts)} notes in {elapsed:.2f}s")
-    print(f"Total: {len(existing)} embeddings ({embeddings_path.stat().st_size / 1024:.1f} KB)")
+    print(f"Total: {len(existing)} embeddings ({size / 1024:.1f} KB)")
 
 
 def show_stats(embeddings_path):
@@ -256,6 +325,9 @@ def show_stats(embeddings_path):
     print(f"Total notes: {data.get('count', len(embeddings))}")
     print(f"Built: {data.get('built', 'unknown')}")
     print(f"File size: {embeddings_path.stat().st_size / 1024:.1f} KB")
+    matrix_path = embeddings_path.parent / data.get("matrix", MATRIX_FILE)
+    if data.get("matrix") and matrix_path.exists():
+        print(f"Matrix size: {matrix_path.stat().st_size / 1024:.1f} KB ({matrix_path.name})")
 
     # By type
     by_type = {}
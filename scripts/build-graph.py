@@ -222,6 +222,10 @@ def resolve_link(link_text, paths_by_stem):
 
 def find_vault_root():
     """Find the vault root."""
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
     path = Path.cwd()
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
@@ -18,6 +18,7 @@ import re
 import sqlite3
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Folders to skip entirely
@@ -30,6 +31,22 @@ SKIP_DIRS = {
 # Files to skip
 SKIP_FILES = {".DS_Store", "Thumbs.db"}
 
+# Changed notes are read in parallel batches; small files on a cold cache
+# are latency-bound, so overlapping the reads helps far more than CPU count
+READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+READ_BATCH = 256
+
+# Bodies beyond this are truncated for the index: the long tail of a huge
+# log or transcript adds little to ranking but a lot to peak memory
+MAX_INDEX_BYTES = 1024 * 1024
+TRUNCATED_MARKER = "\n[...truncated]"
+
+# Frontmatter spellings of a true `encrypted:` flag
+TRUE_VALUES = frozenset({"true", "True", "TRUE", "yes", "1", True})
+
+# Bumped whenever the index layout changes; older databases are re-indexed
+SCHEMA_VERSION = 3
+
 # Frontmatter regex: captures YAML between --- markers
 FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
@@ -98,6 +115,10 @@ def parse_frontmatter(content):
 
 def find_vault_root():
     """Find the vault root by looking for .mekb/ or CLAUDE.md."""
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
     path = Path.cwd()
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
@@ -107,21 +128,27 @@ def find_vault_root():
 
 
 def should_skip(path, vault_root):
-    """Check if a path should be skipped."""
-    rel = path.relative_to(vault_root)
-    parts = rel.parts
-
-    # Skip directories
-    for part in parts[:-1]:
-        if part in SKIP_DIRS:
-            return True
+    """Check if a path should be skipped.
+
+    Works on the string form of the path so no intermediate Path objects
+    are allocated; this runs once per markdown file in the vault.
+    """
+    path_str = os.fspath(path)
+    root_prefix = os.path.join(os.fspath(vault_root), "")
+    if path_str.startswith(root_prefix):
+        path_str = path_str[len(root_prefix):]
+    *dirs, name = path_str.split(os.sep)
+
+    # Skip directories (at any depth)
+    if not SKIP_DIRS.isdisjoint(dirs):
+        return True
 
     # Skip non-markdown files
-    if path.suffix != ".md":
+    if os.path.splitext(name)[1] != ".md":
         return True
 
     # Skip specific files
-    if path.name in SKIP_FILES:
+    if name in SKIP_FILES:
         return True
 
     return False
@@ -137,7 +164,23 @@ def collect_notes(vault_root):
 
 
 def create_schema(conn):
-    """Create the database schema."""
+    """Create the database schema.
+
+    Note bodies live only in fts_notes; the notes table holds metadata.
+    Returns True when the notes rows had to be cleared because there was
+    no FTS copy of their text, so every note gets re-read from disk.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        # Older layouts stored bodies in notes with an external-content FTS
+        # table kept in sync by triggers; the index is a cache, so start over
+        conn.executescript("""
+            DROP TRIGGER IF EXISTS notes_ai;
+            DROP TRIGGER IF EXISTS notes_ad;
+            DROP TRIGGER IF EXISTS notes_au;
+            DROP TABLE IF EXISTS fts_notes;
+            DROP TABLE IF EXISTS notes;
+        """)
+
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS notes (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -150,7 +193,6 @@ def create_schema(conn):
             encrypted INTEGER DEFAULT 0,
             status TEXT,
             verified TEXT,
-            content TEXT,
             mtime REAL NOT NULL
         );
 
@@ -158,56 +200,115 @@ def create_schema(conn):
             key TEXT PRIMARY KEY,
             value TEXT
         );
+
+        -- Stats group by type/classification; the mtime check looks up
+        -- by path and only needs mtime, so (path, mtime) covers it.
+        CREATE INDEX IF NOT EXISTS idx_notes_type ON notes(type);
+        CREATE INDEX IF NOT EXISTS idx_notes_classification ON notes(classification);
+        CREATE INDEX IF NOT EXISTS idx_notes_path_mtime ON notes(path, mtime);
     """)
 
-    # Create FTS5 virtual table (drop and recreate to ensure sync)
-    conn.execute("DROP TABLE IF EXISTS fts_notes")
+    fts_exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'fts_notes'"
+    ).fetchone()
+    reset = False
+    if not fts_exists:
+        # Without the FTS copy there is no text to rebuild from
+        reset = conn.execute("DELETE FROM notes").rowcount > 0
+
+    # FTS5 table written explicitly by index_note/remove_deleted. It keeps
+    # its own copy of the text (not contentless) so snippet() still works.
     conn.execute("""
-        CREATE VIRTUAL TABLE fts_notes USING fts5(
-            title, type, tags, content,
-            content=notes, content_rowid=id
+        CREATE VIRTUAL TABLE IF NOT EXISTS fts_notes USING fts5(
+            title, type, tags, content
         )
     """)
 
-    # Triggers to keep FTS in sync
-    conn.executescript("""
-        CREATE TRIGGER IF NOT EXISTS notes_ai AFTER INSERT ON notes BEGIN
-            INSERT INTO fts_notes(rowid, title, type, tags, content)
-            VALUES (new.id, new.title, new.type, new.tags, new.content);
-        END;
-
-        CREATE TRIGGER IF NOT EXISTS notes_ad AFTER DELETE ON notes BEGIN
-            INSERT INTO fts_notes(fts_notes, rowid, title, type, tags, content)
-            VALUES ('delete', old.id, old.title, old.type, old.tags, old.content);
-        END;
-
-        CREATE TRIGGER IF NOT EXISTS notes_au AFTER UPDATE ON notes BEGIN
-            INSERT INTO fts_notes(fts_notes, rowid, title, type, tags, content)
-            VALUES ('delete', old.id, old.title, old.type, old.tags, old.content);
-            INSERT INTO fts_notes(rowid, title, type, tags, content)
-            VALUES (new.id, new.title, new.type, new.tags, new.content);
-        END;
-    """)
-
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
+    return reset
+
+
+def delete_notes(conn, note_ids):
+    """Delete notes and their FTS rows by id."""
+    params = [(note_id,) for note_id in note_ids]
+    conn.executemany("DELETE FROM fts_notes WHERE rowid = ?", params)
+    conn.executemany("DELETE FROM notes WHERE id = ?", params)
 
 
-def index_note(conn, path, vault_root):
-    """Index a single note into the database."""
+def read_capped(path):
+    """Read up to MAX_INDEX_BYTES of a note as text, marking any truncation."""
+    with path.open("rb") as f:
+        raw = f.read(MAX_INDEX_BYTES + 1)
+    if len(raw) > MAX_INDEX_BYTES:
+        return raw[:MAX_INDEX_BYTES].decode("utf-8", "ignore") + TRUNCATED_MARKER
+    return raw.decode("utf-8", "ignore")
+
+
+def read_note(path):
+    """Stat and read a note. Returns (mtime, content), content None on error.
+
+    The mtime is taken before reading so a concurrent edit is picked up on
+    the next run rather than masked by a newer mtime.
+    """
+    try:
+        mtime = path.stat().st_mtime
+        return mtime, read_capped(path)
+    except (IOError, OSError):
+        return None, None
+
+
+def prefetch_notes(paths):
+    """Read several notes concurrently. Returns {path: (mtime, content)}."""
+    if len(paths) < 2:
+        return {path: read_note(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        return dict(zip(paths, pool.map(read_note, paths)))
+
+
+def find_stale(conn, paths, vault_root):
+    """Return the paths whose mtime is newer than the indexed copy."""
+    indexed = dict(conn.execute("SELECT path, mtime FROM notes").fetchall())
+    stale = []
+    for path in paths:
+        known = indexed.get(str(path.relative_to(vault_root)))
+        try:
+            if known is None or known < path.stat().st_mtime:
+                stale.append(path)
+        except OSError:
+            continue
+    return stale
+
+
+def index_note(conn, path, vault_root, prefetched=None):
+    """Index a single note into the database.
+
+    ``prefetched`` is an optional (mtime, content) pair from read_note();
+    when omitted the file is read here.
+    """
     rel_path = str(path.relative_to(vault_root))
-    mtime = path.stat().st_mtime
+    if prefetched is None:
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return False
+    else:
+        mtime, content = prefetched
+        if mtime is None:
+            return False
 
     # Check if already indexed and up to date
     row = conn.execute(
-        "SELECT mtime FROM notes WHERE path = ?", (rel_path,)
+        "SELECT id, mtime FROM notes WHERE path = ?", (rel_path,)
     ).fetchone()
-    if row and row[0] >= mtime:
+    if row and row[1] >= mtime:
         return False  # Already up to date
 
-    try:
-        content = path.read_text(encoding="utf-8", errors="ignore")
-    except (IOError, OSError):
-        return False
+    if prefetched is None:
+        try:
+            content = read_capped(path)
+        except (IOError, OSError):
+            return False
 
     fm, body = parse_frontmatter(content)
 
@@ -215,7 +316,8 @@ def index_note(conn, path, vault_root):
     classification = fm.get("classification") or "personal"
     if classification == "secret":
         # Remove from index if previously indexed
-        conn.execute("DELETE FROM notes WHERE path = ?", (rel_path,))
+        if row:
+            delete_notes(conn, [row[0]])
         return False
 
     title = fm.get("title") or path.stem
@@ -224,22 +326,32 @@ def index_note(conn, path, vault_root):
     tags = ", ".join(fm.get("tags") or [])
     status = fm.get("status")
     verified = fm.get("verified")
-    is_encrypted = fm.get("encrypted") in ("true", "True", True)
+    is_encrypted = fm.get("encrypted") in TRUE_VALUES
 
     # For encrypted notes, index metadata only (no plaintext body in index)
     indexed_body = "[ENCRYPTED]" if is_encrypted else body
 
     # Upsert
-    conn.execute("""
-        INSERT INTO notes (path, title, type, created, tags, classification, encrypted, status, verified, content, mtime)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    cursor = conn.execute("""
+        INSERT INTO notes (path, title, type, created, tags, classification, encrypted, status, verified, mtime)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ON CONFLICT(path) DO UPDATE SET
             title=excluded.title, type=excluded.type, created=excluded.created,
             tags=excluded.tags, classification=excluded.classification,
             encrypted=excluded.encrypted,
             status=excluded.status, verified=excluded.verified,
-            content=excluded.content, mtime=excluded.mtime
-    """, (rel_path, title, note_type, created, tags, classification, int(is_encrypted), status, verified, indexed_body, mtime))
+            mtime=excluded.mtime
+    """, (rel_path, title, note_type, created, tags, classification, int(is_encrypted), status, verified, mtime))
+
+    if row:
+        note_id = row[0]
+        conn.execute("DELETE FROM fts_notes WHERE rowid = ?", (note_id,))
+    else:
+        note_id = cursor.lastrowid
+    conn.execute(
+        "INSERT INTO fts_notes (rowid, title, type, tags, content) VALUES (?, ?, ?, ?, ?)",
+        (note_id, title, note_type, tags, indexed_body),
+    )
 
     return True
 
@@ -247,21 +359,14 @@ def index_note(conn, path, vault_root):
 def remove_deleted(conn, vault_root, current_paths):
     """Remove notes from index that no longer exist on disk."""
     current_set = {str(p.relative_to(vault_root)) for p in current_paths}
-    indexed = {row[0] for row in conn.execute("SELECT path FROM notes").fetchall()}
-    deleted = indexed - current_set
+    indexed = dict(conn.execute("SELECT path, id FROM notes").fetchall())
+    deleted = [note_id for path, note_id in indexed.items() if path not in current_set]
 
-    for path in deleted:
-        conn.execute("DELETE FROM notes WHERE path = ?", (path,))
+    delete_notes(conn, deleted)
 
     return len(deleted)
 
 
-def rebuild_fts(conn):
-    """Rebuild the FTS index from the notes table."""
-    conn.execute("INSERT INTO fts_notes(fts_notes) VALUES('rebuild')")
-    conn.commit()
-
-
 def show_stats(db_path):
     """Show index statistics."""
     if not db_path.exists():
@@ -329,9 +434,11 @@ def main():
     # Ensure .mekb directory exists
     db_dir.mkdir(exist_ok=True)
 
-    # Force rebuild: delete existing database
+    # Force rebuild: delete existing database, including its WAL sidecars,
+    # which a reader that still has the old index open keeps on disk
     if args.rebuild and db_path.exists():
-        db_path.unlink()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
         if args.verbose:
             print("Removed existing index for full rebuild")
 
@@ -341,29 +448,32 @@ def main():
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
 
-    create_schema(conn)
+    if create_schema(conn) and args.verbose:
+        print("Search table was missing; re-indexing all notes")
 
     # Collect and index notes
     notes = collect_notes(vault_root)
     indexed = 0
-    skipped = 0
 
-    for path in notes:
-        updated = index_note(conn, path, vault_root)
-        if updated:
-            indexed += 1
-            if args.verbose:
-                print(f"  Indexed: {path.relative_to(vault_root)}")
-        else:
-            skipped += 1
+    # Only changed notes are read; the reads are batched across threads
+    pending = find_stale(conn, notes, vault_root)
+    skipped = len(notes) - len(pending)
+
+    for start_idx in range(0, len(pending), READ_BATCH):
+        batch = pending[start_idx:start_idx + READ_BATCH]
+        contents = prefetch_notes(batch)
+        for path in batch:
+            updated = index_note(conn, path, vault_root, contents[path])
+            if updated:
+                indexed += 1
+                if args.verbose:
+                    print(f"  Indexed: {path.relative_to(vault_root)}")
+            else:
+                skipped += 1
 
     # Remove deleted notes from index
     removed = remove_deleted(conn, vault_root, notes)
 
-    # Rebuild FTS if any changes
-    if indexed > 0 or removed > 0:
-        rebuild_fts(conn)
-
     # Update metadata
     conn.execute(
         "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_built', ?)",
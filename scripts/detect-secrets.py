@@ -4,12 +4,21 @@ Secret Detection Script for MeKB
 Scans files for potential secrets before commit.
 """
 
+import io
 import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Secret patterns with descriptions
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Secret patterns with descriptions. Variable-length runs are bounded so
+# crafted input cannot make the scanner backtrack quadratically.
 SECRET_PATTERNS = [
     {
         "name": "AWS Access Key",
@@ -33,22 +42,22 @@ SECRET_PATTERNS = [
     },
     {
         "name": "Generic API Key",
-        "pattern": r"(?i)(api[_\-]?key|apikey)['\"]?\s*[:=]\s*['\"]?([A-Za-z0-9_\-]{20,})",
+        "pattern": r"(?i)(api[_\-]?key|apikey)['\"]?\s*[:=]\s*['\"]?([A-Za-z0-9_\-]{20,256})",
         "severity": "medium"
     },
     {
         "name": "Generic Secret",
-        "pattern": r"(?i)(secret|secret[_\-]?key)['\"]?\s*[:=]\s*['\"]?([A-Za-z0-9_\-]{20,})",
+        "pattern": r"(?i)(secret|secret[_\-]?key)['\"]?\s*[:=]\s*['\"]?([A-Za-z0-9_\-]{20,256})",
         "severity": "medium"
     },
     {
         "name": "Password Assignment",
-        "pattern": r"(?i)(password|passwd|pwd)['\"]?\s*[:=]\s*['\"]?([^\s'\"]{8,})",
+        "pattern": r"(?i)(password|passwd|pwd)['\"]?\s*[:=]\s*['\"]?([^\s'\"]{8,256})",
         "severity": "high"
     },
     {
         "name": "Bearer Token",
-        "pattern": r"(?i)bearer\s+[A-Za-z0-9_\-\.]+",
+        "pattern": r"(?i)bearer\s+[A-Za-z0-9_\-\.]{1,1000}",
         "severity": "high"
     },
     {
@@ -63,7 +72,7 @@ SECRET_PATTERNS = [
     },
     {
         "name": "Connection String",
-        "pattern": r"(?i)(mongodb|postgres|mysql|redis|amqp):\/\/[^\s]+:[^\s]+@",
+        "pattern": r"(?i)(mongodb|postgres|mysql|redis|amqp):\/\/[^\s]{1,256}:[^\s]{1,256}@",
         "severity": "high"
     },
     {
@@ -108,6 +117,45 @@ SECRET_PATTERNS = [
     }
 ]
 
+
+def _scoped(pattern):
+    """Wrap a pattern so it can sit inside an alternation.
+
+    A leading global (?i) becomes a scoped (?i:...) group, since global
+    flags are only allowed at the very start of a combined expression.
+    """
+    if pattern.startswith("(?i)"):
+        return f"(?i:{pattern[4:]})"
+    return f"(?:{pattern})"
+
+
+RE2_MAX_MEM = 64 << 20
+
+
+def _compile_screen(pattern):
+    """Compile with RE2 when installed for linear-time matching, else re."""
+    if HAS_RE2:
+        # The union's DFA outgrows RE2's default 8 MiB budget, which makes
+        # it fall back to a slower engine and log to stderr on every search
+        options = re2.Options()
+        options.max_mem = RE2_MAX_MEM
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+COMPILED_PATTERNS = [
+    (re.compile(p["pattern"]), p["name"], p["severity"]) for p in SECRET_PATTERNS
+]
+
+# Union of every secret pattern. Patterns overlap (e.g. the two private key
+# patterns), so a single alternation cannot report every finding; it is used
+# as a one-pass screen and only lines that hit are rescanned per pattern.
+# RE2 caps counted repeats at 1000, which the bounds above respect.
+ANY_SECRET_RE = _compile_screen("|".join(_scoped(p["pattern"]) for p in SECRET_PATTERNS))
+
 # Files/patterns to ignore
 IGNORE_PATTERNS = [
     r"\.git/",
@@ -122,6 +170,16 @@ IGNORE_PATTERNS = [
     r"\.ico$"
 ]
 
+# Binary files are skipped after sniffing this many leading bytes
+SNIFF_BYTES = 8192
+BINARY_MAGIC = (
+    b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"%PDF", b"PK\x03\x04",
+    b"\x1f\x8b", b"\x7fELF", b"SQLite format 3",
+)
+
+# Files are read by a small thread pool; reads release the GIL
+SCAN_WORKERS = 16
+
 # Known false positives (add patterns here)
 FALSE_POSITIVES = [
     r"example",
@@ -138,20 +196,25 @@ FALSE_POSITIVES = [
 ]
 
 
+# Each list is only ever asked "does any of these match?", so one compiled
+# alternation answers it in a single search
+IGNORE_RE = re.compile("|".join(f"(?:{p})" for p in IGNORE_PATTERNS), re.IGNORECASE)
+FALSE_POSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in FALSE_POSITIVES), re.IGNORECASE)
+
+
 def should_ignore_file(file_path):
     """Check if file should be ignored."""
-    for pattern in IGNORE_PATTERNS:
-        if re.search(pattern, str(file_path), re.IGNORECASE):
-            return True
-    return False
+    return IGNORE_RE.search(str(file_path)) is not None
 
 
 def is_false_positive(match_text):
     """Check if match is a known false positive."""
-    for pattern in FALSE_POSITIVES:
-        if re.search(pattern, match_text, re.IGNORECASE):
-            return True
-    return False
+    return FALSE_POSITIVE_RE.search(match_text) is not None
+
+
+def is_binary(head):
+    """Check the first bytes of a file for a known binary signature or NUL."""
+    return head.startswith(BINARY_MAGIC) or b"\0" in head
 
 
 def scan_file(file_path):
@@ -159,20 +222,35 @@ def scan_file(file_path):
     findings = []
 
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            lines = content.split('\n')
+        with open(file_path, 'rb') as f:
+            if is_binary(f.read(SNIFF_BYTES)):
+                return findings
+            f.seek(0)
+            content = io.TextIOWrapper(f, encoding='utf-8', errors='ignore').read()
     except (IOError, OSError):
         return findings
 
-    for pattern_info in SECRET_PATTERNS:
-        pattern = pattern_info["pattern"]
-        name = pattern_info["name"]
-        severity = pattern_info["severity"]
+    # Screen the whole file in one pass. Any line holding a finding is
+    # touched by some screen match; matches may run past a newline (several
+    # patterns allow \s), so every line a match spans is kept.
+    hit_nums = set()
+    line_num, pos = 1, 0
+    for match in ANY_SECRET_RE.finditer(content):
+        start, end = match.span()
+        line_num += content.count('\n', pos, start)
+        last = line_num + content.count('\n', start, end)
+        hit_nums.update(range(line_num, last + 1))
+        line_num, pos = last, end
+
+    if not hit_nums:
+        return findings
+
+    lines = content.split('\n')
+    hit_lines = [(num, lines[num - 1]) for num in sorted(hit_nums)]
 
-        for line_num, line in enumerate(lines, 1):
-            matches = re.finditer(pattern, line)
-            for match in matches:
+    for regex, name, severity in COMPILED_PATTERNS:
+        for line_num, line in hit_lines:
+            for match in regex.finditer(line):
                 match_text = match.group(0)
 
                 # Skip false positives
@@ -193,9 +271,18 @@ def scan_file(file_path):
     return findings
 
 
+def _scan_all(paths):
+    """Scan paths concurrently, returning findings in path order."""
+    all_findings = []
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        for findings in pool.map(scan_file, paths):
+            all_findings.extend(findings)
+    return all_findings
+
+
 def scan_files(file_list):
     """Scan multiple files for secrets."""
-    all_findings = []
+    paths = []
 
     for file_path in file_list:
         if should_ignore_file(file_path):
@@ -205,32 +292,27 @@ def scan_files(file_list):
         if not path.exists() or not path.is_file():
             continue
 
-        findings = scan_file(path)
-        all_findings.extend(findings)
+        paths.append(path)
 
-    return all_findings
+    return _scan_all(paths)
 
 
 def scan_directory(directory="."):
     """Scan all files in a directory."""
-    all_findings = []
+    return _scan_all([
+        path for path in Path(directory).rglob("*")
+        if path.is_file() and not should_ignore_file(path)
+    ])
 
-    for path in Path(directory).rglob("*"):
-        if path.is_file() and not should_ignore_file(path):
-            findings = scan_file(path)
-            all_findings.extend(findings)
-
-    return all_findings
 
-
-def format_findings(findings):
-    """Format findings for display."""
+def iter_report_lines(findings):
+    """Yield the human-readable report for findings, one line at a time."""
     if not findings:
-        return "✅ No secrets detected.\n"
+        yield "✅ No secrets detected.\n"
+        return
 
-    output = []
-    output.append(f"🚨 SECRETS DETECTED: {len(findings)} potential secret(s) found\n")
-    output.append("=" * 60)
+    yield f"🚨 SECRETS DETECTED: {len(findings)} potential secret(s) found\n"
+    yield "=" * 60
 
     # Group by severity
     by_severity = {"critical": [], "high": [], "medium": [], "low": []}
@@ -246,18 +328,21 @@ def format_findings(findings):
 
     for severity in ["critical", "high", "medium", "low"]:
         if by_severity[severity]:
-            output.append(f"\n{severity_icons[severity]} {severity.upper()} ({len(by_severity[severity])})")
+            yield f"\n{severity_icons[severity]} {severity.upper()} ({len(by_severity[severity])})"
             for f in by_severity[severity]:
-                output.append(f"  {f['file']}:{f['line']}")
-                output.append(f"    Type: {f['type']}")
-                output.append(f"    Match: {f['match']}")
+                yield f"  {f['file']}:{f['line']}"
+                yield f"    Type: {f['type']}"
+                yield f"    Match: {f['match']}"
+
+    yield "\n" + "=" * 60
+    yield "\n⚠️  DO NOT COMMIT THESE FILES"
+    yield "Remove secrets and use environment variables or a secrets manager."
+    yield "\nTo bypass (NOT RECOMMENDED): git commit --no-verify"
 
-    output.append("\n" + "=" * 60)
-    output.append("\n⚠️  DO NOT COMMIT THESE FILES")
-    output.append("Remove secrets and use environment variables or a secrets manager.")
-    output.append("\nTo bypass (NOT RECOMMENDED): git commit --no-verify")
 
-    return "\n".join(output)
+def format_findings(findings):
+    """Format findings for display."""
+    return "\n".join(iter_report_lines(findings))
 
 
 def main():
@@ -297,7 +382,8 @@ def main():
     if args.json:
         print(json.dumps(findings, indent=2))
     else:
-        print(format_findings(findings))
+        # Streamed straight to stdout rather than joined into one string
+        sys.stdout.writelines(f"{line}\n" for line in iter_report_lines(findings))
 
     # Exit with error if secrets found (for pre-commit)
     if findings:
@@ -4,19 +4,21 @@ Encryption/Decryption Script for MeKB
 Encrypt and decrypt note bodies using age, preserving plaintext frontmatter.
 
 Usage:
-    python3 scripts/encrypt.py encrypt <file> [--recipients KEY...]
+    python3 scripts/encrypt.py encrypt <file>... [--recipients KEY...]
     python3 scripts/encrypt.py decrypt <file> [--identity PATH]
     python3 scripts/encrypt.py status <file>
-    python3 scripts/encrypt.py audit [--vault PATH]
+    python3 scripts/encrypt.py audit [--vault PATH] [--no-cache]
 
 File format (split):
     Plaintext YAML frontmatter (always readable) + age-encrypted body.
     Frontmatter gains: encrypted: true, encryption_method: age, encryption_recipients: N
 
 Dependencies: Python 3.9+ (stdlib only), age CLI (brew install age)
+Optional: pyrage (pip install pyrage) encrypts in-process for X25519 keys
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
@@ -24,31 +26,76 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import pyrage
+    HAS_PYRAGE = True
+except ImportError:
+    HAS_PYRAGE = False
+
 # Frontmatter regex: captures YAML between --- markers
 FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 
+# Frontmatter fields read by parse_frontmatter_fields
+FRONTMATTER_FIELDS = frozenset({"encrypted", "encryption_method", "encryption_recipients",
+                                "classification", "title", "type"})
+_ENCRYPTED_TRUE_RE = re.compile(r"^encrypted\s*:\s*(?:true|True)\s*$", re.MULTILINE)
+
 # age ASCII armour markers
 AGE_BEGIN = "-----BEGIN AGE ENCRYPTED FILE-----"
 AGE_END = "-----END AGE ENCRYPTED FILE-----"
+AGE_BEGIN_BYTES = AGE_BEGIN.encode("ascii")
+
+# Frontmatter and the age marker after it sit at the top of a note, so
+# status checks read only this many leading bytes
+HEAD_BYTES = 8192
+
+# Below this many files the audit uses threads; process start-up would
+# cost more than the parsing it spreads across cores
+PARALLEL_AUDIT_MIN = 64
+
+# Classifications whose notes must be encrypted
+LEVELS_TO_ENCRYPT = frozenset({"confidential", "secret"})
+
+# Concurrent age processes when encrypting several files
+AGE_WORKERS = os.cpu_count() or 1
 
 
 def find_vault_root(start=None):
     """Find the vault root by looking for .mekb/ or CLAUDE.md."""
-    path = Path(start) if start else Path.cwd()
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env and not start:
+        return Path(env)
+    return _find_vault_root(Path(start) if start else Path.cwd()) or Path.cwd()
+
+
+@lru_cache(maxsize=16)
+def _find_vault_root(path):
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
             return path
         path = path.parent
-    return Path.cwd()
+    return None
 
 
 def load_config(vault_root):
     """Load encryption config from .mekb/security.json."""
     config_path = vault_root / ".mekb" / "security.json"
-    if not config_path.exists():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
         return {}
+    # Keyed on mtime so an edited config is re-read
+    return dict(_load_config(config_path, mtime))
+
+
+@lru_cache(maxsize=16)
+def _load_config(config_path, mtime):
     try:
         with open(config_path) as f:
             return json.load(f).get("encryption", {})
@@ -56,9 +103,15 @@ def load_config(vault_root):
         return {}
 
 
+@lru_cache(maxsize=1)
+def age_path():
+    """Absolute path of the age CLI, or None; resolved once per process."""
+    return shutil.which("age")
+
+
 def check_age_installed():
     """Check if age CLI is available."""
-    return shutil.which("age") is not None
+    return age_path() is not None
 
 
 def split_frontmatter(content):
@@ -70,12 +123,28 @@ def split_frontmatter(content):
             - body_text is everything after the closing ---
             - has_frontmatter is True if frontmatter was found
     """
-    match = FM_PATTERN.match(content)
-    if not match:
+    # Plain string searches rather than FM_PATTERN: the delimiters are
+    # whole "---" lines (trailing whitespace allowed, so CRLF works too)
+    if not content.startswith("---"):
+        return "", content, False
+    open_end = content.find("\n", 3) + 1
+    if not open_end or content[3:open_end].strip():
+        return "", content, False
+
+    frontmatter_end = 0
+    close = content.find("\n---", open_end - 1)
+    while close >= 0:
+        line_end = content.find("\n", close + 4)
+        if line_end < 0:
+            break
+        if close >= open_end and not content[close + 4:line_end].strip():
+            frontmatter_end = line_end + 1
+            break
+        close = content.find("\n---", close + 1)
+    if not frontmatter_end:
         return "", content, False
 
     # Include the full frontmatter block with delimiters
-    frontmatter_end = match.end()
     frontmatter_text = content[:frontmatter_end]
     body_text = content[frontmatter_end:]
 
@@ -88,32 +157,37 @@ def parse_frontmatter_fields(frontmatter_text):
     if not match:
         return {}
 
-    yaml_text = match.group(1)
+    # One pass over the lines; the first occurrence of a field wins. A full
+    # YAML load (even PyYAML's CSafeLoader) is slower for these few keys and
+    # would make yes/no and date coercion depend on what is installed.
     fields = {}
-
-    for field in ("encrypted", "encryption_method", "encryption_recipients",
-                  "classification", "title", "type"):
-        line_match = re.search(rf"^{field}\s*:\s*(.+)$", yaml_text, re.MULTILINE)
-        if line_match:
-            value = line_match.group(1).strip()
-            if value in ("true", "True"):
-                value = True
-            elif value in ("false", "False"):
-                value = False
-            elif value in ("null", "~", ""):
-                value = None
-            elif value.isdigit():
-                value = int(value)
-            else:
-                # Strip quotes
-                if (value.startswith('"') and value.endswith('"')) or \
-                   (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-            fields[field] = value
+    for line in match.group(1).splitlines():
+        key, sep, value = line.partition(":")
+        key = key.rstrip()
+        if sep and key in FRONTMATTER_FIELDS and key not in fields:
+            fields[key] = _coerce_value(value)
 
     return fields
 
 
+def _coerce_value(value):
+    """Convert a raw frontmatter value to bool, None, int or unquoted str."""
+    value = value.strip()
+    if value in ("true", "True"):
+        return True
+    if value in ("false", "False"):
+        return False
+    if value in ("null", "~", ""):
+        return None
+    if value.isdigit():
+        return int(value)
+    # Strip quotes
+    if (value.startswith('"') and value.endswith('"')) or \
+       (value.startswith("'") and value.endswith("'")):
+        value = value[1:-1]
+    return value
+
+
 def add_encryption_fields(frontmatter_text, recipient_count=1):
     """Add encryption metadata fields to frontmatter.
 
@@ -130,9 +204,8 @@ def add_encryption_fields(frontmatter_text, recipient_count=1):
     if not frontmatter_text.strip():
         return frontmatter_text
 
-    # Check if encryption fields already exist
-    fields = parse_frontmatter_fields(frontmatter_text)
-    if fields.get("encrypted") is True:
+    # Check if encryption fields already exist; only this one field matters
+    if _ENCRYPTED_TRUE_RE.search(frontmatter_text):
         # Update recipient count if changed
         frontmatter_text = re.sub(
             r"^encryption_recipients\s*:\s*\d+",
@@ -142,28 +215,24 @@ def add_encryption_fields(frontmatter_text, recipient_count=1):
         )
         return frontmatter_text
 
-    # Find the closing --- and insert before it
-    lines = frontmatter_text.rstrip("\n").split("\n")
-
-    # Find the last --- line
-    close_idx = None
-    for i in range(len(lines) - 1, 0, -1):
-        if lines[i].strip() == "---":
-            close_idx = i
+    # Find the last --- line (not the opening one) and splice the fields
+    # in front of it
+    text = frontmatter_text.rstrip("\n")
+    line_end = len(text)
+    while True:
+        line_start = text.rfind("\n", 0, line_end) + 1
+        if line_start == 0:
+            return frontmatter_text
+        if text[line_start:line_end].strip() == "---":
             break
+        line_end = line_start - 1
 
-    if close_idx is None:
-        return frontmatter_text
-
-    # Insert encryption fields before closing ---
-    encryption_lines = [
-        "encrypted: true",
-        "encryption_method: age",
-        f"encryption_recipients: {recipient_count}",
-    ]
-
-    lines = lines[:close_idx] + encryption_lines + lines[close_idx:]
-    return "\n".join(lines) + "\n"
+    encryption_lines = (
+        "encrypted: true\n"
+        "encryption_method: age\n"
+        f"encryption_recipients: {recipient_count}\n"
+    )
+    return f"{text[:line_start]}{encryption_lines}{text[line_start:]}\n"
 
 
 def remove_encryption_fields(frontmatter_text):
@@ -199,8 +268,39 @@ def reassemble(frontmatter_text, body_text):
 
 
 def is_encrypted(content):
-    """Check if file content contains an age-encrypted body."""
-    return AGE_BEGIN in content
+    """Check if file content contains an age-encrypted body.
+
+    The armour opens the body, so only its first HEAD_BYTES are searched
+    rather than the whole of a large plaintext note.
+    """
+    _, body, _ = split_frontmatter(content)
+    return AGE_BEGIN in body[:HEAD_BYTES]
+
+
+def _pyrage_recipients(recipients):
+    """Parse recipients for pyrage, or None if any needs the age CLI."""
+    try:
+        return [pyrage.x25519.Recipient.from_str(r) for r in recipients]
+    except pyrage.RecipientError:
+        return None
+
+
+def _pyrage_identities(identity):
+    """Parse an identity file for pyrage, or None if it needs the age CLI.
+
+    Only plain X25519 keys are handled in-process; SSH keys, plugin and
+    passphrase-protected identities are left to age.
+    """
+    keys = [
+        line.strip() for line in identity.read_text().splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+    if not keys or not all(k.startswith("AGE-SECRET-KEY-") for k in keys):
+        return None
+    try:
+        return [pyrage.x25519.Identity.from_str(k) for k in keys]
+    except pyrage.IdentityError:
+        return None
 
 
 def encrypt_body(body, recipients):
@@ -216,29 +316,48 @@ def encrypt_body(body, recipients):
     Raises:
         RuntimeError: If age encryption fails.
     """
+    return _encrypt_bytes(body.encode("utf-8"), recipients).decode("utf-8")
+
+
+def _encrypt_bytes(data, recipients, out=None):
+    """encrypt_body on bytes, so file contents never round-trip through str.
+
+    With a binary file as out, age writes the ciphertext straight into it
+    and nothing is returned.
+    """
     if not recipients:
         raise ValueError("At least one recipient key is required")
 
+    parsed = _pyrage_recipients(recipients) if HAS_PYRAGE else None
+    if parsed is not None:
+        try:
+            ciphertext = pyrage.encrypt(data, parsed, armored=True)
+        except pyrage.EncryptError as e:
+            raise RuntimeError(f"age encryption failed: {e}")
+        return _deliver(ciphertext, out)
+
     if not check_age_installed():
         raise RuntimeError(
             "age is not installed. Install with: brew install age"
         )
 
-    cmd = ["age", "--armor"]
-    for r in recipients:
-        cmd.extend(["-r", r])
+    cmd = _age_argv(tuple(recipients))
 
+    if out is not None:
+        # age writes to the descriptor directly, after anything buffered
+        out.flush()
     result = subprocess.run(
         cmd,
-        input=body.encode("utf-8"),
-        capture_output=True,
+        input=data,
+        stdout=out or subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
 
     if result.returncode != 0:
         stderr = result.stderr.decode("utf-8", errors="replace").strip()
         raise RuntimeError(f"age encryption failed: {stderr}")
 
-    return result.stdout.decode("utf-8")
+    return result.stdout
 
 
 def decrypt_body(encrypted_body, identity_path):
@@ -254,28 +373,99 @@ def decrypt_body(encrypted_body, identity_path):
     Raises:
         RuntimeError: If age decryption fails.
     """
+    return _decrypt_bytes(encrypted_body.encode("utf-8"), identity_path).decode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def _age_argv(recipients):
+    """age encrypt argv for a tuple of recipients, built once per batch."""
+    argv = [age_path(), "--armor"]
+    for r in recipients:
+        argv.extend(["-r", r])
+    return tuple(argv)
+
+
+def _decrypt_bytes(data, identity_path, out=None):
+    """decrypt_body on bytes; out works as for _encrypt_bytes."""
+    identity = Path(identity_path).expanduser()
+    if HAS_PYRAGE and identity.is_file():
+        identities = _pyrage_identities(identity)
+        if identities is not None:
+            try:
+                plaintext = pyrage.decrypt(data, identities)
+            except pyrage.DecryptError as e:
+                raise RuntimeError(f"age decryption failed: {e}")
+            return _deliver(plaintext, out)
+
     if not check_age_installed():
         raise RuntimeError(
             "age is not installed. Install with: brew install age"
         )
 
-    identity = Path(identity_path).expanduser()
     if not identity.exists():
         raise FileNotFoundError(f"Identity file not found: {identity}")
 
-    cmd = ["age", "-d", "-i", str(identity)]
+    cmd = [age_path(), "-d", "-i", str(identity)]
 
+    if out is not None:
+        # age writes to the descriptor directly, after anything buffered
+        out.flush()
     result = subprocess.run(
         cmd,
-        input=encrypted_body.encode("utf-8"),
-        capture_output=True,
+        input=data,
+        stdout=out or subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
 
     if result.returncode != 0:
         stderr = result.stderr.decode("utf-8", errors="replace").strip()
         raise RuntimeError(f"age decryption failed: {stderr}")
 
-    return result.stdout.decode("utf-8")
+    return result.stdout
+
+
+def _read_split(path):
+    """Read a note as bytes and split it at the end of its frontmatter.
+
+    The split runs on a latin-1 view, whose characters map one-to-one to
+    bytes, so the body is never decoded; only the frontmatter is.
+
+    Returns:
+        tuple: (frontmatter_text, body_bytes, has_frontmatter)
+    """
+    raw = path.read_bytes()
+    frontmatter_view, _, has_fm = split_frontmatter(raw.decode("latin-1"))
+    split_at = len(frontmatter_view)
+    return raw[:split_at].decode("utf-8"), raw[split_at:], has_fm
+
+
+def _deliver(data, out):
+    """Return data, or write it to out when one was given."""
+    if out is None:
+        return data
+    out.write(data)
+    return None
+
+
+@contextmanager
+def _replace_file(path):
+    """Yield a binary temp file beside path that replaces it on success.
+
+    age writes into it directly, so a failed run leaves the note untouched
+    rather than truncated.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            # On disk before the rename, so a crash can't leave an empty note
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 def encrypt_file(file_path, recipients, dry_run=False):
@@ -292,25 +482,20 @@ def encrypt_file(file_path, recipients, dry_run=False):
         True if file was encrypted, False if already encrypted or skipped.
     """
     path = Path(file_path)
-    content = path.read_text(encoding="utf-8")
-
-    frontmatter_text, body_text, has_fm = split_frontmatter(content)
+    frontmatter_text, body, has_fm = _read_split(path)
 
     # Already encrypted?
-    if is_encrypted(content):
+    if AGE_BEGIN_BYTES in body[:HEAD_BYTES]:
         return False
 
     # Nothing to encrypt?
-    if not body_text.strip():
+    if not body.strip():
         return False
 
     if dry_run:
         print(f"Would encrypt: {path}")
         return True
 
-    # Encrypt the body
-    encrypted_body = encrypt_body(body_text, recipients)
-
     # Add encryption fields to frontmatter
     if has_fm:
         frontmatter_text = add_encryption_fields(frontmatter_text, len(recipients))
@@ -324,12 +509,42 @@ def encrypt_file(file_path, recipients, dry_run=False):
             "---\n"
         )
 
-    # Write back
-    result = reassemble(frontmatter_text, encrypted_body)
-    path.write_text(result, encoding="utf-8")
+    # Encrypt the body, streaming age's output into the replacement file
+    with _replace_file(path) as f:
+        f.write(frontmatter_text.encode("utf-8"))
+        _encrypt_bytes(body, recipients, out=f)
     return True
 
 
+def encrypt_many(files, recipients, dry_run=False):
+    """Encrypt several markdown files, running age for them concurrently.
+
+    Each file still gets its own age process (age has no multi-message
+    mode), but the processes overlap instead of running one after another.
+
+    Args:
+        files: Paths to the markdown files.
+        recipients: List of age recipient public keys.
+        dry_run: If True, print what would happen without modifying files.
+
+    Returns:
+        List of (file, result) pairs in input order, where result is
+        encrypt_file's True/False or the exception it raised. One failure
+        doesn't hide the outcome for the files that were encrypted.
+    """
+    # A tuple, so every worker hits the same cached age argv
+    recipients = tuple(recipients)
+
+    def encrypt(file):
+        try:
+            return encrypt_file(file, recipients, dry_run=dry_run)
+        except (OSError, RuntimeError, ValueError) as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=AGE_WORKERS) as pool:
+        return list(zip(files, pool.map(encrypt, files)))
+
+
 def decrypt_file(file_path, identity_path, dry_run=False):
     """Decrypt a markdown file in-place.
 
@@ -344,30 +559,32 @@ def decrypt_file(file_path, identity_path, dry_run=False):
         True if file was decrypted, False if not encrypted.
     """
     path = Path(file_path)
-    content = path.read_text(encoding="utf-8")
+    frontmatter_text, encrypted_body, has_fm = _read_split(path)
 
-    if not is_encrypted(content):
+    if AGE_BEGIN_BYTES not in encrypted_body[:HEAD_BYTES]:
         return False
 
-    frontmatter_text, encrypted_body, has_fm = split_frontmatter(content)
-
     if dry_run:
         print(f"Would decrypt: {path}")
         return True
 
-    # Decrypt the body
-    plaintext_body = decrypt_body(encrypted_body, identity_path)
-
     # Remove encryption fields from frontmatter
     if has_fm:
         frontmatter_text = remove_encryption_fields(frontmatter_text)
 
-    # Write back
-    result = reassemble(frontmatter_text, plaintext_body)
-    path.write_text(result, encoding="utf-8")
+    # Decrypt the body, streaming age's output into the replacement file
+    with _replace_file(path) as f:
+        f.write(frontmatter_text.encode("utf-8"))
+        _decrypt_bytes(encrypted_body, identity_path, out=f)
     return True
 
 
+def peek_head(path, n=HEAD_BYTES):
+    """Read the first n bytes of a file."""
+    with open(path, "rb") as f:
+        return f.read(n)
+
+
 def file_status(file_path):
     """Check encryption status of a file.
 
@@ -375,8 +592,13 @@ def file_status(file_path):
         dict with keys: path, encrypted, classification, encryption_method
     """
     path = Path(file_path)
-    content = path.read_text(encoding="utf-8")
+    head = peek_head(path)
+    content = head.decode("utf-8", errors="replace")
     frontmatter_text, body_text, has_fm = split_frontmatter(content)
+    if not has_fm and len(head) == HEAD_BYTES and content.startswith("---"):
+        # Frontmatter longer than the head: fall back to the whole file
+        content = path.read_text(encoding="utf-8")
+        frontmatter_text, body_text, has_fm = split_frontmatter(content)
     fields = parse_frontmatter_fields(frontmatter_text) if has_fm else {}
 
     return {
@@ -390,9 +612,90 @@ def file_status(file_path):
     }
 
 
-def audit_vault(vault_root):
+def iter_vault_notes(vault):
+    """Yield markdown files in the vault, skipping hidden dirs and templates.
+
+    Skipped directories are pruned from the walk rather than filtered out
+    afterwards, so large .git or Archive trees are never listed.
+    """
+    for dirpath, dirnames, filenames in os.walk(vault):
+        dirnames[:] = [
+            d for d in dirnames
+            if not d.startswith(".") and d not in ("Templates", "Archive")
+        ]
+        for filename in filenames:
+            if filename.endswith(".md"):
+                yield Path(dirpath) / filename
+
+
+def audit_status(head):
+    """Quickly classify a note from its first bytes.
+
+    Only the classification and the age marker decide the audit bucket.
+
+    Returns:
+        (encrypted, classification), or None if the frontmatter runs past
+        the head and the whole file has to be read.
+    """
+    content = head.decode("utf-8", errors="replace")
+    frontmatter_text, _, has_fm = split_frontmatter(content)
+    if not has_fm and len(head) == HEAD_BYTES and content.startswith("---"):
+        return None
+    classification = parse_frontmatter_fields(frontmatter_text).get("classification", "personal")
+    return is_encrypted(content), classification
+
+
+def _audit_status(file_path):
+    """Status for the audit pool; unreadable files yield None.
+
+    The full file_status is only built for notes the audit reports on.
+    """
+    try:
+        quick = audit_status(peek_head(file_path))
+        if quick is not None:
+            encrypted, classification = quick
+            if not encrypted and classification not in LEVELS_TO_ENCRYPT:
+                return {"path": str(file_path), "encrypted": False,
+                        "classification": classification}
+        return file_status(file_path)
+    except (IOError, OSError):
+        return None
+
+
+def _audit_generator_hash():
+    """Hash of this script, so parser changes invalidate cached statuses."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def load_audit_cache(cache_path):
+    """Load cached audit statuses: rel_path -> {mtime, size, status}."""
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("generator") != _audit_generator_hash():
+        return {}
+    return data.get("files", {})
+
+
+def save_audit_cache(cache_path, entries):
+    """Persist audit statuses; a read-only vault just goes uncached."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({
+            "generator": _audit_generator_hash(),
+            "files": entries,
+        }))
+    except OSError:
+        pass
+
+
+def audit_vault(vault_root, use_cache=True):
     """Audit encryption status of all classified files.
 
+    Statuses are cached in .mekb/audit-cache.json keyed on each file's
+    mtime and size, so a repeat audit only reads notes that changed.
+
     Returns:
         dict with summary and lists of files needing attention.
     """
@@ -404,30 +707,54 @@ def audit_vault(vault_root):
         "total_checked": 0,
     }
 
-    levels_to_encrypt = {"confidential", "secret"}
+    cache_path = vault / ".mekb" / "audit-cache.json"
+    cache = load_audit_cache(cache_path) if use_cache else {}
 
-    for md_file in vault.rglob("*.md"):
-        # Skip hidden dirs and templates
-        rel = md_file.relative_to(vault)
-        parts = rel.parts
-        if any(p.startswith(".") for p in parts[:-1]):
-            continue
-        if "Templates" in parts or "Archive" in parts:
+    # Entries for every note found this run; deleted notes drop out
+    entries = {}
+    statuses = {}
+    pending = []
+    for path in iter_vault_notes(vault):
+        try:
+            st = path.stat()
+        except OSError:
             continue
+        rel = str(path.relative_to(vault))
+        entry = cache.get(rel)
+        if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            statuses[rel] = entry["status"]
+        else:
+            entry = {"mtime": st.st_mtime_ns, "size": st.st_size, "status": None}
+            pending.append((rel, path))
+        entries[rel] = entry
 
-        try:
-            status = file_status(md_file)
-        except (IOError, OSError):
+    if len(pending) < PARALLEL_AUDIT_MIN:
+        executor = ThreadPoolExecutor()
+    else:
+        executor = ProcessPoolExecutor()
+    with executor:
+        fresh = executor.map(_audit_status, [path for _, path in pending], chunksize=32)
+        for (rel, _), status in zip(pending, fresh):
+            statuses[rel] = entries[rel]["status"] = status
+
+    if use_cache:
+        save_audit_cache(cache_path, {
+            rel: entry for rel, entry in entries.items() if entry["status"] is not None
+        })
+
+    for rel in entries:
+        status = statuses[rel]
+        if status is None:
             continue
 
         results["total_checked"] += 1
         cls = status["classification"]
 
-        if cls in levels_to_encrypt and status["encrypted"]:
+        if cls in LEVELS_TO_ENCRYPT and status["encrypted"]:
             results["encrypted_correct"].append(status)
-        elif cls in levels_to_encrypt and not status["encrypted"]:
+        elif cls in LEVELS_TO_ENCRYPT and not status["encrypted"]:
             results["unencrypted_classified"].append(status)
-        elif cls not in levels_to_encrypt and status["encrypted"]:
+        elif cls not in LEVELS_TO_ENCRYPT and status["encrypted"]:
             results["encrypted_unclassified"].append(status)
 
     return results
@@ -468,8 +795,8 @@ def main():
     subparsers = parser.add_subparsers(dest="command", help="Command")
 
     # encrypt
-    enc = subparsers.add_parser("encrypt", help="Encrypt a note")
-    enc.add_argument("file", help="Path to markdown file")
+    enc = subparsers.add_parser("encrypt", help="Encrypt one or more notes")
+    enc.add_argument("files", nargs="+", help="Paths to markdown files")
     enc.add_argument("--recipient", "-r", action="append", dest="recipients",
                      help="age recipient public key (repeatable)")
     enc.add_argument("--dry-run", action="store_true", help="Show what would happen")
@@ -488,6 +815,8 @@ def main():
     au = subparsers.add_parser("audit", help="Audit vault encryption")
     au.add_argument("--vault", help="Vault root directory")
     au.add_argument("--json", action="store_true", help="Output as JSON")
+    au.add_argument("--no-cache", action="store_true",
+                    help="Re-read every note instead of using .mekb/audit-cache.json")
 
     args = parser.parse_args()
 
@@ -505,17 +834,23 @@ def main():
                   file=sys.stderr)
             sys.exit(1)
 
-        if not check_age_installed():
+        if not HAS_PYRAGE and not check_age_installed():
             print("Error: age is not installed. Install with: brew install age",
                   file=sys.stderr)
             sys.exit(1)
 
-        encrypted = encrypt_file(args.file, recipients, dry_run=args.dry_run)
-        if encrypted:
-            action = "Would encrypt" if args.dry_run else "Encrypted"
-            print(f"{action}: {args.file}")
-        else:
-            print(f"Skipped (already encrypted or empty body): {args.file}")
+        failed = 0
+        for file, result in encrypt_many(args.files, recipients, dry_run=args.dry_run):
+            if isinstance(result, Exception):
+                print(f"Failed: {file} - {result}", file=sys.stderr)
+                failed += 1
+            elif result:
+                action = "Would encrypt" if args.dry_run else "Encrypted"
+                print(f"{action}: {file}")
+            else:
+                print(f"Skipped (already encrypted or empty body): {file}")
+        if failed:
+            sys.exit(1)
 
     elif args.command == "decrypt":
         vault_root = find_vault_root()
@@ -527,7 +862,7 @@ def main():
                   file=sys.stderr)
             sys.exit(1)
 
-        if not check_age_installed():
+        if not HAS_PYRAGE and not check_age_installed():
             print("Error: age is not installed. Install with: brew install age",
                   file=sys.stderr)
             sys.exit(1)
@@ -549,7 +884,7 @@ def main():
 
     elif args.command == "audit":
         vault_root = Path(args.vault) if args.vault else find_vault_root()
-        results = audit_vault(vault_root)
+        results = audit_vault(vault_root, use_cache=not args.no_cache)
 
         if args.json:
             # Simplify for JSON output
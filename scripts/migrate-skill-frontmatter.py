@@ -14,12 +14,22 @@ Dependencies: Python 3.9+ (stdlib only)
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Only the start of a skill file decides whether it has frontmatter
+HEAD_BYTES = 512
+READ_WORKERS = 16
+
 
 def find_vault_root():
     """Find the vault root."""
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
     path = Path.cwd()
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
@@ -28,11 +38,38 @@ def find_vault_root():
     return Path.cwd()
 
 
+def find_skills(skills_dir):
+    """Sorted SKILL.md paths, one per skill directory, from a single scandir."""
+    try:
+        with os.scandir(skills_dir) as it:
+            dirs = [entry.path for entry in it if entry.is_dir()]
+    except OSError:
+        return []
+    return sorted(p for p in (Path(d) / "SKILL.md" for d in dirs) if p.is_file())
+
+
 def has_frontmatter(content):
     """Check if content starts with YAML frontmatter."""
     return content.strip().startswith("---")
 
 
+def file_has_frontmatter(path):
+    """Check a file for frontmatter by reading only its first bytes."""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(HEAD_BYTES)
+            head = chunk.decode("utf-8", errors="ignore").lstrip()
+            # Keep reading only through a run of leading whitespace
+            if head or len(chunk) < HEAD_BYTES:
+                return has_frontmatter(head)
+
+
+def frontmatter_flags(paths):
+    """file_has_frontmatter for each path, read concurrently."""
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        return list(pool.map(file_has_frontmatter, paths))
+
+
 def add_frontmatter(content, skill_name):
     """Prepend YAML frontmatter with name field."""
     return f"---\nname: {skill_name}\n---\n\n{content}"
@@ -40,24 +77,22 @@ def add_frontmatter(content, skill_name):
 
 def migrate(vault_root, dry_run=False):
     """Add frontmatter to all skills that lack it."""
-    skills_dir = vault_root / ".claude" / "skills"
-    skills = sorted(skills_dir.glob("*/SKILL.md"))
+    skills = find_skills(vault_root / ".claude" / "skills")
 
     migrated = 0
     skipped = 0
 
-    for path in skills:
-        content = path.read_text()
+    for path, has_fm in zip(skills, frontmatter_flags(skills)):
         skill_name = path.parent.name
 
-        if has_frontmatter(content):
+        if has_fm:
             skipped += 1
             if not dry_run:
                 continue
             print(f"  SKIP: {skill_name}/SKILL.md (already has frontmatter)")
             continue
 
-        new_content = add_frontmatter(content, skill_name)
+        new_content = add_frontmatter(path.read_text(), skill_name)
 
         if dry_run:
             print(f"  WOULD ADD: {skill_name}/SKILL.md")
@@ -76,13 +111,11 @@ def migrate(vault_root, dry_run=False):
 
 def validate(vault_root):
     """Check all skills have frontmatter."""
-    skills_dir = vault_root / ".claude" / "skills"
-    skills = sorted(skills_dir.glob("*/SKILL.md"))
+    skills = find_skills(vault_root / ".claude" / "skills")
 
     missing = []
-    for path in skills:
-        content = path.read_text()
-        if not has_frontmatter(content):
+    for path, has_fm in zip(skills, frontmatter_flags(skills)):
+        if not has_fm:
             missing.append(path.parent.name)
 
     if missing:
@@ -17,59 +17,245 @@ Optional: Slack/Discord webhook URLs, SMTP config in .mekb/notifications.yaml
 """
 
 import argparse
+import atexit
+import http.client
 import json
 import os
 import platform
+import select
+import smtplib
 import subprocess
 import sys
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from functools import lru_cache
 from pathlib import Path
 
 
 def find_vault_root():
     """Find the vault root."""
-    path = Path.cwd()
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
+    return _find_vault_root(Path.cwd()) or Path.cwd()
+
+
+@lru_cache(maxsize=8)
+def _find_vault_root(path):
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
             return path
         path = path.parent
-    return Path.cwd()
+    return None
+
+
+# Scalars the config parser converts, by lowercased value
+_SCALARS = {"true": True, "false": False, "null": None, "": None}
 
 
 def load_config(vault_root):
     """Load notification config from .mekb/notifications.yaml."""
     config_path = vault_root / ".mekb" / "notifications.yaml"
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return {}
+    # Keyed on mtime and size so an edited config is re-read; sections are
+    # copied so callers can't change the cached dict
+    config = _load_config(config_path, st.st_mtime_ns, st.st_size)
+    return {section: dict(values) for section, values in config.items()}
+
 
-    # Simple YAML parser (no pyyaml dependency)
+@lru_cache(maxsize=16)
+def _load_config(config_path, mtime, size):
+    # Simple YAML parser (no pyyaml dependency). Not cached on disk: parsing
+    # takes well under a millisecond, and a cache file would be a second
+    # plaintext copy of smtp_pass
     config = {}
     current_section = None
-    content = config_path.read_text()
 
-    for line in content.split("\n"):
+    for line in config_path.read_text().splitlines():
         stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+        if not stripped or stripped[0] == "#":
             continue
 
-        if not line.startswith(" ") and stripped.endswith(":"):
+        if not line.startswith(" ") and stripped[-1] == ":":
             current_section = stripped[:-1]
             config[current_section] = {}
         elif current_section and ":" in stripped:
             key, _, value = stripped.partition(":")
             value = value.strip().strip("\"'")
-            if value.lower() == "true":
-                value = True
-            elif value.lower() == "false":
-                value = False
-            elif value.lower() == "null" or value == "":
-                value = None
-            config[current_section][key.strip()] = value
+            config[current_section][key.rstrip()] = _SCALARS.get(value.lower(), value)
+
+    # Parse webhook URLs here, once, so a malformed one fails at startup
+    # rather than on the first send
+    for name in ("slack", "discord"):
+        url = config.get(name, {}).get("webhook_url")
+        if url:
+            config[name]["_parsed"] = _parse_webhook_url(name, url)
 
     return config
 
 
+def _parse_webhook_url(name, url):
+    """Split a webhook URL, raising ValueError unless it is http(s) with a host."""
+    try:
+        parts = urllib.parse.urlsplit(url)
+    except ValueError:
+        parts = None
+    if parts is None or parts.scheme not in ("http", "https") or not parts.hostname:
+        # The URL itself is a credential, so it stays out of the message
+        raise ValueError(f"{name}.webhook_url is not a valid http(s) URL")
+    return parts
+
+
+# ---------------------------------------------------------------------------
+# Connections
+# ---------------------------------------------------------------------------
+
+# Open webhook connections, per thread since http.client connections
+# can't be shared; keyed on (scheme, netloc)
+_http = threading.local()
+
+
+def _uses_proxy(parts):
+    """True if urllib would send a request for these URL parts via a proxy."""
+    return (parts.scheme in urllib.request.getproxies()
+            and not urllib.request.proxy_bypass(parts.hostname or ""))
+
+
+def _is_dropped(conn):
+    """True if the server has closed this idle kept-alive connection.
+
+    An idle connection has nothing to read, so a readable socket means
+    the server sent EOF (or an error) while it sat in the pool.
+    """
+    if conn.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _post_json(url, payload):
+    """POST payload as JSON to url and return the HTTP status.
+
+    url may be a string or an already split URL (a SplitResult). Connections
+    stay open per host, so repeated sends skip the TCP and TLS handshakes.
+    Proxied URLs go through urllib instead. Error statuses raise
+    urllib.error.HTTPError, as urlopen does.
+    """
+    data = json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if isinstance(url, urllib.parse.SplitResult):
+        parts, url = url, url.geturl()
+    else:
+        parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or _uses_proxy(parts):
+        req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return resp.status
+
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    conns = getattr(_http, "conns", None)
+    if conns is None:
+        conns = _http.conns = {}
+    key = (parts.scheme, parts.netloc)
+
+    conn = conns.get(key)
+    if conn is not None and _is_dropped(conn):
+        conn.close()
+        conn = None
+    for attempt in range(2):
+        if conn is None:
+            if parts.scheme == "https":
+                conn = http.client.HTTPSConnection(parts.netloc, timeout=10)
+            else:
+                conn = http.client.HTTPConnection(parts.netloc, timeout=10)
+            conns[key] = conn
+        try:
+            conn.request("POST", path, body=data, headers=headers)
+        except (ConnectionResetError, BrokenPipeError):
+            # Closed before the request went out; safe to send it once more
+            conn.close()
+            del conns[key]
+            conn = None
+            if attempt:
+                raise
+            continue
+        except Exception:
+            conn.close()
+            del conns[key]
+            raise
+        break
+
+    # No retry once the request is sent: a webhook POST isn't idempotent,
+    # and a connection dropped before the response (RemoteDisconnected)
+    # may still have delivered the notification
+    try:
+        resp = conn.getresponse()
+        resp.read()
+    except Exception:
+        conn.close()
+        del conns[key]
+        raise
+
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return resp.status
+
+
+# Logged-in SMTP sessions keyed on (host, port, user, password). An SMTP
+# session can't be shared between threads, so sends hold the lock
+_smtp_sessions = {}
+_smtp_lock = threading.Lock()
+
+
+def _smtp_session(host, port, user, password):
+    """Return a live SMTP session, reusing an open one if it answers NOOP."""
+    key = (host, port, user, password)
+    server = _smtp_sessions.pop(key, None)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                _smtp_sessions[key] = server
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        server.close()
+
+    server = smtplib.SMTP(host, port)
+    try:
+        if port == 587:
+            server.starttls()
+        if user and password:
+            server.login(user, password)
+    except BaseException:
+        server.close()
+        raise
+    _smtp_sessions[key] = server
+    return server
+
+
+@atexit.register
+def _close_smtp_sessions():
+    while _smtp_sessions:
+        _, server = _smtp_sessions.popitem()
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
 # ---------------------------------------------------------------------------
 # Backends
 # ---------------------------------------------------------------------------
@@ -100,15 +286,7 @@ def send_slack(title, message, webhook_url):
         "text": f"*{title}*\n{message}",
         "unfurl_links": False,
     }
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        webhook_url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        return resp.status == 200
+    return _post_json(webhook_url, payload) == 200
 
 
 def send_discord(title, message, webhook_url):
@@ -119,22 +297,12 @@ def send_discord(title, message, webhook_url):
     payload = {
         "content": f"**{title}**\n{message}",
     }
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        webhook_url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        return resp.status == 204 or resp.status == 200
+    status = _post_json(webhook_url, payload)
+    return status == 204 or status == 200
 
 
 def send_email(title, message, config):
-    """Send email via SMTP."""
-    import smtplib
-    from email.mime.text import MIMEText
-
+    """Send email via SMTP, reusing the session across calls."""
     smtp_host = config.get("smtp_host", "localhost")
     smtp_port = int(config.get("smtp_port", 587))
     smtp_user = config.get("smtp_user")
@@ -150,12 +318,15 @@ def send_email(title, message, config):
     msg["From"] = from_addr or "mekb@localhost"
     msg["To"] = to_addr
 
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        if smtp_port == 587:
-            server.starttls()
-        if smtp_user and smtp_pass:
-            server.login(smtp_user, smtp_pass)
-        server.send_message(msg)
+    with _smtp_lock:
+        server = _smtp_session(smtp_host, smtp_port, smtp_user, smtp_pass)
+        try:
+            server.send_message(msg)
+        except BaseException:
+            # The session is in an unknown state; don't hand it out again
+            _smtp_sessions.pop((smtp_host, smtp_port, smtp_user, smtp_pass), None)
+            server.close()
+            raise
 
     return True
 
@@ -165,10 +336,11 @@ def send_email(title, message, config):
 # ---------------------------------------------------------------------------
 
 BACKENDS = {
-    "desktop": {"name": "Desktop (macOS)", "platforms": ["Darwin"]},
-    "slack": {"name": "Slack Webhook", "platforms": ["any"]},
-    "discord": {"name": "Discord Webhook", "platforms": ["any"]},
-    "email": {"name": "Email (SMTP)", "platforms": ["any"]},
+    "desktop": {"name": "Desktop (macOS)", "platforms": ["Darwin"], "setup": ""},
+    "slack": {"name": "Slack Webhook", "platforms": ["any"], "setup": "Set slack.webhook_url"},
+    "discord": {"name": "Discord Webhook", "platforms": ["any"],
+                "setup": "Set discord.webhook_url"},
+    "email": {"name": "Email (SMTP)", "platforms": ["any"], "setup": "Set email.to"},
 }
 
 
@@ -209,11 +381,12 @@ def send_notification(title, message, backend=None, config=None):
         if backend == "desktop":
             return send_desktop(title, message)
         elif backend == "slack":
-            webhook = config.get("slack", {}).get("webhook_url")
-            return send_slack(title, message, webhook)
+            slack = config.get("slack", {})
+            return send_slack(title, message, slack.get("_parsed") or slack.get("webhook_url"))
         elif backend == "discord":
-            webhook = config.get("discord", {}).get("webhook_url")
-            return send_discord(title, message, webhook)
+            discord = config.get("discord", {})
+            return send_discord(title, message,
+                                discord.get("_parsed") or discord.get("webhook_url"))
         elif backend == "email":
             email_config = config.get("email", {})
             return send_email(title, message, email_config)
@@ -238,8 +411,7 @@ def cmd_test(config):
         print("Or use: python3 scripts/notify.py 'Test' 'Hello' --backend desktop")
         return
 
-    print(f"Testing {len(available)} backend(s)...\n")
-    for backend in available:
+    def test(backend):
         try:
             ok = send_notification(
                 "MeKB Test",
@@ -247,10 +419,16 @@ def cmd_test(config):
                 backend=backend,
                 config=config,
             )
-            status = "OK" if ok else "FAILED"
-            print(f"  {BACKENDS[backend]['name']:<25} {status}")
+            return "OK" if ok else "FAILED"
         except Exception as e:
-            print(f"  {BACKENDS[backend]['name']:<25} ERROR: {e}")
+            return f"ERROR: {e}"
+
+    print(f"Testing {len(available)} backend(s)...\n")
+    # Each backend is a network round-trip; send them all at once so the
+    # test takes the slowest backend's time rather than the sum
+    with ThreadPoolExecutor(max_workers=len(available)) as pool:
+        for backend, status in zip(available, pool.map(test, available)):
+            print(f"  {BACKENDS[backend]['name']:<25} {status}")
 
 
 def cmd_list(config):
@@ -263,19 +441,12 @@ def cmd_list(config):
     print(f"  {'-'*25} {'-'*12} {'-'*30}")
 
     for key, info in BACKENDS.items():
-        is_available = key in available
-        status = "Available" if is_available else "Not configured"
-
-        notes = ""
-        if key == "desktop" and system != "Darwin":
-            status = "Unavailable"
-            notes = "macOS only"
-        elif key == "slack" and not is_available:
-            notes = "Set slack.webhook_url"
-        elif key == "discord" and not is_available:
-            notes = "Set discord.webhook_url"
-        elif key == "email" and not is_available:
-            notes = "Set email.to"
+        if "any" not in info["platforms"] and system not in info["platforms"]:
+            status, notes = "Unavailable", "macOS only"
+        elif key in available:
+            status, notes = "Available", ""
+        else:
+            status, notes = "Not configured", info["setup"]
 
         print(f"  {info['name']:<25} {status:<12} {notes}")
 
@@ -298,7 +469,11 @@ def main():
     args = parser.parse_args()
 
     vault_root = Path(args.vault) if args.vault else find_vault_root()
-    config = load_config(vault_root)
+    try:
+        config = load_config(vault_root)
+    except ValueError as e:
+        print(f"Error in .mekb/notifications.yaml: {e}", file=sys.stderr)
+        sys.exit(1)
 
     if args.test:
         cmd_test(config)
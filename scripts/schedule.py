@@ -6,7 +6,7 @@ Manages scheduled maintenance jobs using platform-native tools.
 Usage:
     python3 scripts/schedule.py list                # Show available jobs
     python3 scripts/schedule.py install              # Install all scheduled jobs
-    python3 scripts/schedule.py install rebuild-index # Install specific job
+    python3 scripts/schedule.py install rebuild-index # Install specific job(s)
     python3 scripts/schedule.py uninstall             # Remove all scheduled jobs
     python3 scripts/schedule.py status               # Show active jobs
     python3 scripts/schedule.py run <job>            # Run a job now
@@ -24,7 +24,11 @@ import platform
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from string import Template
+from xml.sax.saxutils import escape
 
 # Job definitions
 JOBS = {
@@ -58,19 +62,61 @@ JOBS = {
     },
 }
 
+# Split each command once into its script and arguments
+for _job in JOBS.values():
+    _, _job["_script"], *_job["_args"] = _job["command"].split()
+
 LABEL_PREFIX = "com.mekb"
+# Trailing comment tagging MeKB's crontab entries: "# mekb:<job>"
+CRON_MARKER = "# mekb:"
 DAY_MAP = {"Monday": 1, "Tuesday": 2, "Wednesday": 3, "Thursday": 4,
            "Friday": 5, "Saturday": 6, "Sunday": 7}
+# Crontab uses 0=Sunday
+CRON_DAY_MAP = {day: number % 7 for day, number in DAY_MAP.items()}
+
+
+# launchd job skeleton; values are XML-escaped before substitution
+_PLIST_TEMPLATE = Template("""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>$label</string>
+    <key>ProgramArguments</key>
+    <array>
+$args_xml
+    </array>
+    <key>WorkingDirectory</key>
+    <string>$working_dir</string>
+    <key>StartCalendarInterval</key>
+$calendar
+    <key>StandardOutPath</key>
+    <string>$log_dir/$job.log</string>
+    <key>StandardErrorPath</key>
+    <string>$log_dir/$job.error.log</string>
+    <key>RunAtLoad</key>
+    <false/>
+</dict>
+</plist>
+""")
 
 
 def find_vault_root():
     """Find the vault root."""
-    path = Path.cwd()
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
+    return _find_vault_root(Path.cwd()) or Path.cwd()
+
+
+@lru_cache(maxsize=8)
+def _find_vault_root(path):
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
             return path
         path = path.parent
-    return Path.cwd()
+    return None
 
 
 def is_macos():
@@ -95,24 +141,22 @@ def generate_plist(job_name, job, vault_root):
     """Generate a macOS launchd plist for a job."""
     label = f"{LABEL_PREFIX}.{job_name}"
     python = get_python()
-    script = str(vault_root / job["command"].split(" ", 1)[1])
-    script_args = job["command"].split(" ")[2:] if len(job["command"].split(" ")) > 2 else []
-    hour, minute = job["time"].split(":")
+    script = str(vault_root / job["_script"])
+    script_args = job["_args"]
+    hour, minute = (int(part) for part in job["time"].split(":"))
     log_dir = vault_root / ".mekb" / "logs"
 
     # Build program arguments
-    args_xml = f"        <string>{python}</string>\n"
-    args_xml += f"        <string>{script}</string>\n"
-    for arg in script_args:
-        args_xml += f"        <string>{arg}</string>\n"
+    args_xml = "\n".join(f"        <string>{escape(arg)}</string>"
+                         for arg in (python, script, *script_args))
 
     # Build calendar interval
     if job["schedule"] == "daily":
         calendar = f"""        <dict>
             <key>Hour</key>
-            <integer>{int(hour)}</integer>
+            <integer>{hour}</integer>
             <key>Minute</key>
-            <integer>{int(minute)}</integer>
+            <integer>{minute}</integer>
         </dict>"""
     elif job["schedule"] == "weekly":
         weekday = DAY_MAP.get(job.get("day", "Sunday"), 7)
@@ -120,36 +164,21 @@ def generate_plist(job_name, job, vault_root):
             <key>Weekday</key>
             <integer>{weekday}</integer>
             <key>Hour</key>
-            <integer>{int(hour)}</integer>
+            <integer>{hour}</integer>
             <key>Minute</key>
-            <integer>{int(minute)}</integer>
+            <integer>{minute}</integer>
         </dict>"""
     else:
         calendar = ""
 
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{label}</string>
-    <key>ProgramArguments</key>
-    <array>
-{args_xml.rstrip()}
-    </array>
-    <key>WorkingDirectory</key>
-    <string>{vault_root}</string>
-    <key>StartCalendarInterval</key>
-{calendar}
-    <key>StandardOutPath</key>
-    <string>{log_dir}/{job_name}.log</string>
-    <key>StandardErrorPath</key>
-    <string>{log_dir}/{job_name}.error.log</string>
-    <key>RunAtLoad</key>
-    <false/>
-</dict>
-</plist>
-"""
+    return _PLIST_TEMPLATE.substitute(
+        label=escape(label),
+        args_xml=args_xml,
+        working_dir=escape(str(vault_root)),
+        calendar=calendar,
+        log_dir=escape(str(log_dir)),
+        job=escape(job_name),
+    )
 
 
 def generate_crontab_entry(job_name, job, vault_root):
@@ -161,15 +190,19 @@ def generate_crontab_entry(job_name, job, vault_root):
     if job["schedule"] == "daily":
         schedule = f"{minute} {hour} * * *"
     elif job["schedule"] == "weekly":
-        weekday = DAY_MAP.get(job.get("day", "Sunday"), 0)
-        # Crontab uses 0=Sunday
-        cron_day = weekday % 7
+        cron_day = CRON_DAY_MAP.get(job.get("day", "Sunday"), 0)
         schedule = f"{minute} {hour} * * {cron_day}"
     else:
         return ""
 
-    cmd = f"cd {vault_root} && {python} {job['command'].split(' ', 1)[1]}"
-    return f"{schedule} {cmd} >> {log_dir}/{job_name}.log 2>&1 # mekb:{job_name}"
+    cmd = f"cd {vault_root} && {python} {' '.join([job['_script'], *job['_args']])}"
+    return f"{schedule} {cmd} >> {log_dir}/{job_name}.log 2>&1 {CRON_MARKER}{job_name}"
+
+
+def cron_job_name(line):
+    """Return the MeKB job a crontab line belongs to, or None."""
+    _, marker, name = line.rpartition(CRON_MARKER)
+    return name.strip() if marker else None
 
 
 def install_macos(jobs_to_install, vault_root):
@@ -179,26 +212,35 @@ def install_macos(jobs_to_install, vault_root):
     log_dir = vault_root / ".mekb" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    installed = []
-    for name, job in JOBS.items():
-        if jobs_to_install and name not in jobs_to_install:
-            continue
+    names = [name for name in JOBS if not jobs_to_install or name in jobs_to_install]
+    plist_paths = [agents_dir / f"{LABEL_PREFIX}.{name}.plist" for name in names]
+    domain = f"gui/{os.getuid()}"
 
-        label = f"{LABEL_PREFIX}.{name}"
-        plist_path = agents_dir / f"{label}.plist"
-        plist_content = generate_plist(name, job, vault_root)
+    # Unload existing jobs in one call
+    existing = [str(path) for path in plist_paths if path.exists()]
+    if existing:
+        subprocess.run(["launchctl", "bootout", domain, *existing],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-        # Unload existing if present
-        if plist_path.exists():
-            subprocess.run(["launchctl", "unload", str(plist_path)],
-                         capture_output=True)
+    for name, plist_path in zip(names, plist_paths):
+        plist_path.write_text(generate_plist(name, JOBS[name], vault_root))
 
-        plist_path.write_text(plist_content)
+    # Load them all in one call; only if that fails ask launchd which
+    # jobs did not load
+    result = subprocess.run(["launchctl", "bootstrap", domain, *map(str, plist_paths)],
+                            capture_output=True, text=True)
+    failed = set()
+    if result.returncode != 0:
+        for name in names:
+            probe = subprocess.run(["launchctl", "print", f"{domain}/{LABEL_PREFIX}.{name}"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if probe.returncode != 0:
+                failed.add(name)
 
-        # Load the job
-        result = subprocess.run(["launchctl", "load", str(plist_path)],
-                              capture_output=True, text=True)
-        if result.returncode == 0:
+    installed = []
+    for name in names:
+        job = JOBS[name]
+        if name not in failed:
             installed.append(name)
             print(f"  Installed: {name} ({job['schedule']} at {job['time']})")
         else:
@@ -220,8 +262,13 @@ def install_linux(jobs_to_install, vault_root):
     result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
     existing = result.stdout if result.returncode == 0 else ""
 
-    # Remove existing mekb entries
-    lines = [l for l in existing.strip().split("\n") if "# mekb:" not in l]
+    # Drop the entries being reinstalled; a partial install keeps the
+    # other MeKB jobs, so installing one job at a time doesn't undo the last
+    def replaced(line):
+        name = cron_job_name(line)
+        return name is not None and (not jobs_to_install or name in jobs_to_install)
+
+    lines = [l for l in existing.splitlines() if not replaced(l)]
 
     # Add new entries
     installed = []
@@ -255,7 +302,7 @@ def uninstall_macos():
         plist_path = agents_dir / f"{label}.plist"
         if plist_path.exists():
             subprocess.run(["launchctl", "unload", str(plist_path)],
-                         capture_output=True)
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             plist_path.unlink()
             removed += 1
             print(f"  Removed: {name}")
@@ -269,9 +316,10 @@ def uninstall_linux():
         print("No crontab found.")
         return
 
-    lines = [l for l in result.stdout.strip().split("\n") if "# mekb:" not in l]
+    lines = [l for l in result.stdout.splitlines() if cron_job_name(l) is None]
     new_crontab = "\n".join(lines) + "\n" if lines else ""
-    subprocess.run(["crontab", "-"], input=new_crontab, text=True, capture_output=True)
+    subprocess.run(["crontab", "-"], input=new_crontab, text=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     print("MeKB crontab entries removed.")
 
 
@@ -280,32 +328,39 @@ def show_status():
     if is_macos():
         agents_dir = get_launch_agents_dir()
         print("\nScheduled jobs (macOS launchd):\n")
-        found = False
+        installed = [name for name in JOBS
+                     if (agents_dir / f"{LABEL_PREFIX}.{name}.plist").exists()]
+
+        def is_loaded(name):
+            result = subprocess.run(["launchctl", "list", f"{LABEL_PREFIX}.{name}"],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return result.returncode == 0
+
+        # Check the installed jobs concurrently; each check is a launchctl exec
+        loaded = {}
+        if installed:
+            with ThreadPoolExecutor(max_workers=len(installed)) as pool:
+                loaded = dict(zip(installed, pool.map(is_loaded, installed)))
+
         for name, job in JOBS.items():
-            label = f"{LABEL_PREFIX}.{name}"
-            plist_path = agents_dir / f"{label}.plist"
-            if plist_path.exists():
-                found = True
-                # Check if loaded
-                result = subprocess.run(
-                    ["launchctl", "list", label],
-                    capture_output=True, text=True
-                )
-                status = "loaded" if result.returncode == 0 else "installed (not loaded)"
-                print(f"  {name:<25} {status:<20} {job['schedule']} at {job['time']}")
+            if name not in loaded:
+                status = "not installed"
+            elif loaded[name]:
+                status = "loaded"
             else:
-                print(f"  {name:<25} {'not installed':<20} {job['schedule']} at {job['time']}")
-        if not found:
+                status = "installed (not loaded)"
+            print(f"  {name:<25} {status:<20} {job['schedule']} at {job['time']}")
+        if not installed:
             print("  No jobs installed. Run: python3 scripts/schedule.py install")
     elif is_linux():
         result = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
         print("\nScheduled jobs (crontab):\n")
         if result.returncode == 0:
             found = False
-            for line in result.stdout.split("\n"):
-                if "# mekb:" in line:
+            for line in result.stdout.splitlines():
+                job_name = cron_job_name(line)
+                if job_name is not None:
                     found = True
-                    job_name = line.split("# mekb:")[1].strip()
                     print(f"  {job_name}: {line.split('#')[0].strip()}")
             if not found:
                 print("  No MeKB jobs in crontab. Run: python3 scripts/schedule.py install")
@@ -344,7 +399,7 @@ def main():
     parser = argparse.ArgumentParser(description="MeKB job scheduler")
     parser.add_argument("action", choices=["list", "install", "uninstall", "status", "run"],
                        help="Action to perform")
-    parser.add_argument("job", nargs="?", help="Specific job name (for install/run)")
+    parser.add_argument("job", nargs="*", help="Job name(s) (one for run)")
     parser.add_argument("--vault", help="Vault root directory")
     args = parser.parse_args()
 
@@ -354,9 +409,10 @@ def main():
         list_jobs()
 
     elif args.action == "install":
-        jobs_filter = [args.job] if args.job else None
-        if jobs_filter and args.job not in JOBS:
-            print(f"Unknown job: {args.job}")
+        jobs_filter = args.job or None
+        unknown = [name for name in args.job if name not in JOBS]
+        if unknown:
+            print(f"Unknown job: {', '.join(unknown)}")
             print(f"Available: {', '.join(JOBS.keys())}")
             sys.exit(1)
 
@@ -383,12 +439,12 @@ def main():
         show_status()
 
     elif args.action == "run":
-        if not args.job:
-            print("Specify a job to run. Available:")
+        if len(args.job) != 1:
+            print("Specify one job to run. Available:")
             for name in JOBS:
                 print(f"  {name}")
             sys.exit(1)
-        sys.exit(run_job(args.job, vault_root))
+        sys.exit(run_job(args.job[0], vault_root))
 
 
 if __name__ == "__main__":
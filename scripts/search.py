@@ -17,26 +17,99 @@ Three search tiers:
 
 Dependencies: Python 3.9+ (stdlib only)
 Optional: sentence-transformers (for vector search)
+Optional: simsimd (pip install simsimd) for SIMD cosine similarity
+Optional: orjson (pip install orjson) for faster embeddings/graph loading
 """
 
 import argparse
+import ast
+import hashlib
+import heapq
+import importlib.util
 import json
 import math
 import os
 import re
 import sqlite3
+import struct
 import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 
+# numpy and simsimd are imported by load_numpy() on first use: numpy alone
+# adds ~100 ms to startup, which FTS5-only searches never need
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_SIMSIMD = HAS_NUMPY and importlib.util.find_spec("simsimd") is not None
+np = None
+simsimd = None
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# FTS5 operator characters that could cause syntax errors (str.translate table)
+FTS_SPECIAL_CHARS = str.maketrans("", "", "{}()[]^~")
+
+# FTS5 boolean keywords dropped from multi-term queries
+FTS_KEYWORDS = frozenset({"AND", "OR", "NOT", "NEAR"})
+
+# Punctuation dropped when a query still fails to parse
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
+# Model used when embeddings.json doesn't name one (as in build-embeddings.py)
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+# Past query embeddings kept in .mekb/query-cache/
+QUERY_CACHE_MAX = 256
+
 
 def find_vault_root():
     """Find the vault root by looking for .mekb/ or CLAUDE.md."""
-    path = Path.cwd()
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
+    return _find_vault_root(Path.cwd()) or Path.cwd()
+
+
+@lru_cache(maxsize=8)
+def _find_vault_root(path):
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
             return path
         path = path.parent
-    return Path.cwd()
+    return None
+
+
+_index = threading.local()
+
+
+def open_index(db_path):
+    """Read-only connection to search.db, reused by later searches.
+
+    One connection per thread and database, kept while the file on disk is
+    the same; a rebuilt index (new inode or mtime) gets a fresh connection.
+    The index is memory-mapped rather than read through the page cache.
+    """
+    st = db_path.stat()
+    stamp = (st.st_dev, st.st_ino, st.st_mtime_ns)
+    conns = getattr(_index, "conns", None)
+    if conns is None:
+        conns = _index.conns = {}
+    cached = conns.get(str(db_path))
+    if cached and cached[0] == stamp:
+        return cached[1]
+    if cached:
+        cached[1].close()
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA cache_size = -64000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conns[str(db_path)] = (stamp, conn)
+    return conn
 
 
 def fts5_search(db_path, query, note_type=None, limit=20, exclude_classifications=None):
@@ -44,15 +117,13 @@ def fts5_search(db_path, query, note_type=None, limit=20, exclude_classification
     if not db_path.exists():
         return []
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-
     # Escape FTS5 special characters and build query
     fts_query = sanitise_fts_query(query)
     if not fts_query:
-        conn.close()
         return []
 
+    conn = open_index(db_path)
+
     sql = """
         SELECT n.path, n.title, n.type, n.tags, n.classification,
                n.created, n.status, n.verified, n.encrypted,
@@ -80,7 +151,7 @@ def fts5_search(db_path, query, note_type=None, limit=20, exclude_classification
         rows = conn.execute(sql, params).fetchall()
     except sqlite3.OperationalError:
         # FTS5 query syntax error - fall back to simple term search
-        simple_query = re.sub(r'[^\w\s]', '', query)
+        simple_query = NON_WORD_PATTERN.sub('', query)
         if simple_query:
             params[0] = simple_query
             try:
@@ -90,24 +161,22 @@ def fts5_search(db_path, query, note_type=None, limit=20, exclude_classification
         else:
             rows = []
 
-    results = []
-    for row in rows:
-        results.append({
-            "path": row["path"],
-            "title": row["title"],
-            "type": row["type"],
-            "tags": row["tags"],
-            "classification": row["classification"],
-            "created": row["created"],
-            "status": row["status"],
-            "verified": row["verified"],
-            "encrypted": bool(row["encrypted"]) if "encrypted" in row.keys() else False,
-            "bm25_score": abs(row["bm25_rank"]) if row["bm25_rank"] else 0,
-            "snippet": clean_snippet(row["snippet"]),
-            "source": "fts5",
-        })
-
-    conn.close()
+    # Plain tuples in SELECT order; cheaper than sqlite3.Row lookups by name
+    results = [{
+        "path": path,
+        "title": title,
+        "type": row_type,
+        "tags": tags,
+        "classification": classification,
+        "created": created,
+        "status": status,
+        "verified": verified,
+        "encrypted": bool(encrypted),
+        "bm25_score": abs(bm25_rank) if bm25_rank else 0,
+        "snippet": clean_snippet(snippet),
+        "source": "fts5",
+    } for (path, title, row_type, tags, classification, created, status, verified,
+           encrypted, bm25_rank, snippet) in rows]
     return results
 
 
@@ -118,7 +187,7 @@ def sanitise_fts_query(query):
         return query
 
     # Remove FTS5 operators that could cause syntax errors
-    query = re.sub(r'[{}()\[\]^~]', '', query)
+    query = query.translate(FTS_SPECIAL_CHARS)
 
     # Split into terms and rejoin
     terms = query.split()
@@ -128,7 +197,7 @@ def sanitise_fts_query(query):
     # If multiple terms, search for all of them
     if len(terms) > 1:
         # Use implicit AND (space-separated in FTS5)
-        return " ".join(t for t in terms if t.upper() not in ("AND", "OR", "NOT", "NEAR"))
+        return " ".join(t for t in terms if t.upper() not in FTS_KEYWORDS)
 
     return terms[0]
 
@@ -143,49 +212,172 @@ def clean_snippet(snippet):
 
 def vector_search(embeddings_path, query, limit=20):
     """Search using pre-computed vector embeddings with cosine similarity."""
-    if not embeddings_path.exists():
-        return []
-
     try:
-        with open(embeddings_path, "r") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, IOError):
+        st = embeddings_path.stat()
+        data, paths, matrix = load_embeddings(embeddings_path, st.st_mtime_ns, st.st_size)
+    except (ValueError, IndexError, OSError):
         return []
 
-    embeddings = data.get("embeddings", {})
-    if not embeddings:
+    if not paths:
         return []
 
     # Try to compute query embedding
-    query_embedding = compute_query_embedding(query, data.get("model"))
+    query_embedding = cached_query_embedding(
+        embeddings_path.parent / "query-cache", query, data.get("model"))
     if not query_embedding:
         return []
 
-    # Compute cosine similarity for each note
-    scored = []
-    for path, entry in embeddings.items():
-        vec = entry.get("vector", [])
-        if not vec:
-            continue
-        similarity = cosine_similarity(query_embedding, vec)
-        scored.append({
-            "path": path,
-            "title": entry.get("title", Path(path).stem),
-            "type": entry.get("type"),
-            "vector_score": similarity,
-            "source": "vector",
-        })
-
-    # Sort by similarity descending
-    scored.sort(key=lambda x: x["vector_score"], reverse=True)
-    return scored[:limit]
+    embeddings = data["embeddings"]
+    if matrix is not None:
+        # Rows are unit length, so cosine similarity is one matrix-vector
+        # product; only the top `limit` are then sorted
+        scores = unit_dot_scores(matrix, query_embedding)
+        order = np.arange(len(scores))
+        if 0 < limit < len(scores):
+            order = np.argpartition(-scores, limit)[:limit]
+        order = order[np.argsort(-scores[order], kind="stable")][:limit]
+        ranked = [(paths[i], float(scores[i])) for i in order.tolist()]
+    else:
+        vectors = [embeddings[path]["vector"] for path in paths]
+        scores = cosine_similarities(query_embedding, vectors, data.get("normalized", False))
+        scored = zip(paths, scores)
+        ranked = heapq.nlargest(limit, scored, key=lambda x: x[1])
+
+    return [{
+        "path": path,
+        "title": embeddings[path].get("title", Path(path).stem),
+        "type": embeddings[path].get("type"),
+        "vector_score": similarity,
+        "source": "vector",
+    } for path, similarity in ranked]
+
+
+def load_numpy():
+    """Import numpy, and simsimd when installed, if not yet imported."""
+    global np, simsimd, HAS_NUMPY, HAS_SIMSIMD
+    if np is not None or not HAS_NUMPY:
+        return
+    try:
+        import numpy as np
+    except ImportError:
+        HAS_NUMPY = HAS_SIMSIMD = False
+        return
+    if HAS_SIMSIMD:
+        try:
+            import simsimd
+        except ImportError:
+            HAS_SIMSIMD = False
+
+
+@lru_cache(maxsize=4)
+def load_embeddings(embeddings_path, mtime, size):
+    """Parse embeddings.json once per (mtime, size).
+
+    Vectors are either inline ("vector" per entry) or, as build-embeddings.py
+    now writes them, rows of a float16 .npy file named by "matrix", with each
+    entry giving its "row". The .npy is memory-mapped with numpy and read
+    with read_npy() without it.
+
+    Returns (data, paths, matrix): the parsed file, the paths that have a
+    vector, and with numpy those vectors as L2-normalised rows in the same
+    order (None without numpy). Rows are float32, or the stored float16
+    when the file is marked "normalized" and SimSIMD is available.
+    """
+    load_numpy()
+    data = read_json(embeddings_path)
+    embeddings = data.setdefault("embeddings", {})
+    if data.get("matrix"):
+        matrix_path = embeddings_path.parent / data["matrix"]
+        paths = sorted((path for path, entry in embeddings.items()
+                        if isinstance(entry.get("row"), int)),
+                       key=lambda path: embeddings[path]["row"])
+        rows = [embeddings[path]["row"] for path in paths]
+        if not paths:
+            return data, paths, None
+        if HAS_NUMPY:
+            stored = np.load(matrix_path, mmap_mode="r")
+            vectors = stored if rows == list(range(len(stored))) else stored[rows]
+            if not data.get("normalized"):
+                return data, paths, unit_rows(vectors, stored.shape[1])
+            # Already unit length: SimSIMD scores the float16 rows in place,
+            # numpy gets one float32 copy instead of a copy per query
+            if not HAS_SIMSIMD:
+                vectors = np.asarray(vectors, dtype=np.float32)
+            return data, paths, vectors
+        stored = read_npy(matrix_path)
+        for path, row in zip(paths, rows):
+            embeddings[path]["vector"] = stored[row]
+        return data, paths, None
+
+    paths = [path for path, entry in embeddings.items() if entry.get("vector")]
+    matrix = None
+    if HAS_NUMPY and paths:
+        vectors = [embeddings[path]["vector"] for path in paths]
+        matrix = unit_rows(vectors, data.get("dimension") or len(vectors[0]))
+    return data, paths, matrix
+
+
+def read_npy(path):
+    """Read a 2-D little-endian float16/float32 .npy file as lists of floats.
+
+    Covers what build-embeddings.py writes, for when numpy isn't installed.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:6] != b"\x93NUMPY":
+        raise ValueError(f"{path} is not a .npy file")
+    if raw[6] == 1:
+        header_len, start = struct.unpack_from("<H", raw, 8)[0], 10
+    else:
+        header_len, start = struct.unpack_from("<I", raw, 8)[0], 12
+    header = ast.literal_eval(raw[start:start + header_len].decode("latin1"))
+    code = {"<f2": "e", "<f4": "f"}.get(header["descr"])
+    shape = header["shape"]
+    if code is None or header["fortran_order"] or len(shape) != 2:
+        raise ValueError(f"{path}: unsupported array {header}")
+    rows, dim = shape
+    values = struct.unpack_from(f"<{rows * dim}{code}", raw, start + header_len)
+    return [list(values[i:i + dim]) for i in range(0, rows * dim, dim)]
+
+
+def unit_rows(vectors, dim):
+    """Stack vectors into a float32 matrix with each row scaled to length 1.
+
+    Rows of another dimension are left zero, so like zero vectors they
+    score 0.0.
+    """
+    try:
+        matrix = np.asarray(vectors, dtype=np.float32)
+    except ValueError:
+        matrix = None
+    if matrix is None or matrix.shape != (len(vectors), dim):
+        matrix = np.zeros((len(vectors), dim), dtype=np.float32)
+        for i, vec in enumerate(vectors):
+            if len(vec) == dim:
+                matrix[i] = vec
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    matrix /= norms
+    return matrix
+
+
+def unit_dot_scores(matrix, query):
+    """Cosine similarity of query against each row of a unit_rows matrix."""
+    q = np.asarray(query, dtype=np.float32)
+    norm = float(np.linalg.norm(q))
+    if q.shape != (matrix.shape[1],) or not norm:
+        return np.zeros(len(matrix), dtype=np.float32)
+    q /= norm
+    if HAS_SIMSIMD:
+        q = q.astype(matrix.dtype, copy=False)
+        return np.asarray(simsimd.cdist(q[None, :], matrix, metric="dot"))[0]
+    return matrix @ q
 
 
 def compute_query_embedding(query, model_name=None):
     """Compute embedding for a query string. Returns None if not available."""
     try:
-        from sentence_transformers import SentenceTransformer
-        model = SentenceTransformer(model_name or "all-MiniLM-L6-v2")
+        model = load_model(model_name or DEFAULT_MODEL)
         embedding = model.encode(query).tolist()
         return embedding
     except ImportError:
@@ -194,6 +386,47 @@ def compute_query_embedding(query, model_name=None):
         return None
 
 
+@lru_cache(maxsize=2)
+def load_model(model_name):
+    """Load a SentenceTransformer once per process."""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
+def cached_query_embedding(cache_dir, query, model_name=None):
+    """compute_query_embedding, remembering results in cache_dir.
+
+    A repeated query is read back from disk without loading the model.
+    Entries are named by a hash of model and query, so the query text isn't
+    stored and a different model never hits another model's entry. The
+    oldest entries beyond QUERY_CACHE_MAX are removed.
+    """
+    model_name = model_name or DEFAULT_MODEL
+    key = hashlib.sha256(f"{model_name}\0{query}".encode("utf-8")).hexdigest()
+    entry = cache_dir / f"{key}.json"
+    try:
+        embedding = json.loads(entry.read_text())
+        if isinstance(embedding, list) and embedding:
+            return embedding
+    except (OSError, ValueError):
+        pass
+
+    embedding = compute_query_embedding(query, model_name)
+    if not embedding:
+        return embedding
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(embedding))
+        os.replace(tmp, entry)
+        entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+        for old in entries[:-QUERY_CACHE_MAX]:
+            old.unlink()
+    except OSError:
+        pass
+    return embedding
+
+
 def cosine_similarity(vec_a, vec_b):
     """Compute cosine similarity between two vectors."""
     if len(vec_a) != len(vec_b) or not vec_a:
@@ -209,6 +442,34 @@ def cosine_similarity(vec_a, vec_b):
     return dot_product / (norm_a * norm_b)
 
 
+def cosine_similarities(query, vectors, normalized=False):
+    """Cosine similarity of query against each of vectors, in order.
+
+    With numpy the vectors are scored as one matrix; otherwise (and for a
+    zero query) each pair goes through cosine_similarity. If the vectors
+    are known to be unit length, only the query is normalised and each
+    score is a plain dot product.
+    """
+    load_numpy()
+    if normalized and not HAS_NUMPY and any(query):
+        norm = math.sqrt(sum(a * a for a in query))
+        q = [a / norm for a in query]
+        return [sum(a * b for a, b in zip(q, vec)) if len(vec) == len(q) else 0.0
+                for vec in vectors]
+    if not HAS_NUMPY or not any(query) or not vectors:
+        return [cosine_similarity(query, vec) for vec in vectors]
+    return unit_dot_scores(unit_rows(vectors, len(query)), query).tolist()
+
+
+def read_json(path):
+    """Parse a JSON file, with orjson when it is installed."""
+    if HAS_ORJSON:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 def load_graph_degrees(vault_root):
     """Load node degree data from graph.json for centrality boosting."""
     graph_path = vault_root / ".mekb" / "graph.json"
@@ -216,8 +477,7 @@ def load_graph_degrees(vault_root):
         return {}
 
     try:
-        with open(graph_path, "r") as f:
-            data = json.load(f)
+        data = read_json(graph_path)
         degrees = {}
         nodes = data.get("nodes", {})
         if not nodes:
@@ -233,12 +493,13 @@ def load_graph_degrees(vault_root):
 
 
 def hybrid_search(fts_results, vector_results, graph_degrees=None,
-                  fts_weight=0.7, vector_weight=0.3, graph_weight=0.1):
+                  fts_weight=0.7, vector_weight=0.3, graph_weight=0.1, limit=None):
     """Fuse FTS5 and vector results using reciprocal rank fusion.
 
     When graph_degrees is available, applies a centrality boost:
     hub notes (more connections) get a small ranking advantage.
     Weights are renormalised to sum to 1.0 when graph is present.
+    With a limit, only the top `limit` fused results are returned.
     """
     # Renormalise weights when graph is present
     if graph_degrees:
@@ -282,6 +543,8 @@ def hybrid_search(fts_results, vector_results, graph_degrees=None,
         data["source"] = "hybrid"
         fused.append(data)
 
+    if limit is not None:
+        return heapq.nlargest(limit, fused, key=lambda x: x["fusion_score"])
     fused.sort(key=lambda x: x["fusion_score"], reverse=True)
     return fused
 
@@ -332,16 +595,14 @@ def format_results(results, explain=False):
 
 def format_json(results):
     """Output results as JSON."""
-    output = []
-    for r in results:
-        output.append({
-            "path": r["path"],
-            "title": r.get("title"),
-            "type": r.get("type"),
-            "score": r.get("fusion_score") or r.get("bm25_score") or r.get("vector_score", 0),
-            "snippet": r.get("snippet"),
-            "source": r.get("source"),
-        })
+    output = [{
+        "path": r["path"],
+        "title": r.get("title"),
+        "type": r.get("type"),
+        "score": r.get("fusion_score") or r.get("bm25_score") or r.get("vector_score", 0),
+        "snippet": r.get("snippet"),
+        "source": r.get("source"),
+    } for r in results]
     print(json.dumps(output, indent=2))
 
 
@@ -385,12 +646,10 @@ def main():
     if not args.fts_only and embeddings_path.exists():
         vec_results = vector_search(embeddings_path, args.query, limit=args.limit)
 
-    # Load graph centrality data for ranking boost
-    graph_degrees = load_graph_degrees(vault_root)
-
-    # Tier 3: Hybrid fusion (when both exist)
+    # Tier 3: Hybrid fusion (when both exist), with a graph centrality boost
     if fts_results and vec_results and not args.fts_only and not args.vector_only:
-        results = hybrid_search(fts_results, vec_results, graph_degrees)[:args.limit]
+        graph_degrees = load_graph_degrees(vault_root)
+        results = hybrid_search(fts_results, vec_results, graph_degrees, limit=args.limit)
     elif fts_results:
         results = fts_results
     elif vec_results:
@@ -19,17 +19,36 @@ import os
 import re
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Command header on the first line after frontmatter: "# /name"
+COMMAND_PATTERN = re.compile(r"# /(\w[\w-]*)")
+
+# Scripts a skill runs: "python3 scripts/x.py" or "node scripts/x.js"
+SCRIPT_REF_PATTERN = re.compile(r"(?:python3|node)\s+scripts/(\S+)")
+
+# Level-2 section headings
+SECTION_PATTERN = re.compile(r"^## .+$", re.MULTILINE)
+
 
 def find_vault_root():
     """Find the vault root."""
-    path = Path.cwd()
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
+    return _find_vault_root(Path.cwd()) or Path.cwd()
+
+
+@lru_cache(maxsize=8)
+def _find_vault_root(path):
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
             return path
         path = path.parent
-    return Path.cwd()
+    return None
 
 
 def get_skills_dir(vault_root):
@@ -39,8 +58,12 @@ def get_skills_dir(vault_root):
 
 def parse_skill(path):
     """Parse a skill file and extract metadata."""
-    content = path.read_text()
-    lines = content.strip().split("\n")
+    # Every field needs the whole file (script refs and sections can be
+    # anywhere), so read it once and take the size from the bytes read
+    # rather than a separate stat
+    raw = path.read_bytes()
+    content = raw.decode("utf-8", errors="replace")
+    lines = content.strip().splitlines()
 
     # Skip YAML frontmatter block if present
     start = 0
@@ -54,7 +77,7 @@ def parse_skill(path):
     command = None
     for line in lines[start:]:
         if line.strip():
-            match = re.match(r"# /(\w[\w-]*)", line)
+            match = COMMAND_PATTERN.match(line)
             if match:
                 command = match.group(1)
             break
@@ -66,11 +89,11 @@ def parse_skill(path):
                        "## Step" in content)
 
     # Find script references
-    script_refs = re.findall(r"(?:python3|node)\s+scripts/(\S+)", content)
+    script_refs = SCRIPT_REF_PATTERN.findall(content)
     script_refs = [s.rstrip("`'\")}") for s in script_refs]
 
     # Count sections
-    sections = re.findall(r"^## .+$", content, re.MULTILINE)
+    sections = SECTION_PATTERN.findall(content)
 
     # Derive skill name from parent directory (subdirectory layout)
     skill_name = path.parent.name if path.name == "SKILL.md" else path.stem
@@ -84,7 +107,7 @@ def parse_skill(path):
         "script_refs": script_refs,
         "sections": len(sections),
         "lines": len(lines),
-        "size": path.stat().st_size,
+        "size": len(raw),
     }
 
 
@@ -97,8 +120,12 @@ def list_skills(vault_root):
     print(f"  {'Command':<18} {'Skill':<22} {'Lines':>5}  {'Sections':>8}  Scripts")
     print(f"  {'-'*18} {'-'*22} {'-'*5}  {'-'*8}  {'-'*20}")
 
-    for path in skills:
-        info = parse_skill(path)
+    # Skill files are read in parallel (slow on synced or network drives),
+    # then printed in order
+    with ThreadPoolExecutor() as pool:
+        infos = list(pool.map(parse_skill, skills))
+
+    for info in infos:
         cmd = f"/{info['command']}" if info['command'] else "?"
         scripts = ", ".join(info["script_refs"]) if info["script_refs"] else "-"
         print(f"  {cmd:<18} {info['skill_name']:<22} {info['lines']:>5}  {info['sections']:>8}  {scripts}")
@@ -142,8 +169,12 @@ def validate_all(vault_root, verbose=False):
     total_issues = 0
     print(f"\nValidating {len(skills)} skills...\n")
 
-    for path in skills:
-        issues = validate_skill(path, vault_root, verbose)
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(lambda path: validate_skill(path, vault_root), skills))
+
+    for path, issues in zip(skills, results):
+        if verbose and not issues:
+            print(f"  OK: {path.name}")
         if issues:
             skill_name = path.parent.name
             print(f"  {skill_name}/SKILL.md:")
@@ -159,6 +190,30 @@ def validate_all(vault_root, verbose=False):
     return total_issues
 
 
+# Linux ioctl cloning one file's extents into another (btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+
+
+def _fast_copy(src, dst):
+    """shutil.copy2, made a copy-on-write clone where the filesystem allows.
+
+    A clone shares the source's blocks, so nothing is read or written.
+    Anywhere else (other platforms and filesystems, or dst a directory)
+    this is just shutil.copy2, which already copies in the kernel.
+    """
+    if sys.platform.startswith("linux") and not (
+            os.path.exists(dst) and (os.path.isdir(dst) or os.path.samefile(src, dst))):
+        import fcntl
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
 def export_skill(skill_name, vault_root):
     """Export a skill as a .mekb-skill directory."""
     skills_dir = get_skills_dir(vault_root)
@@ -177,14 +232,14 @@ def export_skill(skill_name, vault_root):
     export_dir.mkdir(exist_ok=True)
 
     # Copy skill file
-    shutil.copy2(skill_path, export_dir / "SKILL.md")
+    _fast_copy(skill_path, export_dir / "SKILL.md")
 
     # Copy referenced scripts
     for ref in info["script_refs"]:
         src = vault_root / "scripts" / ref
         if src.exists():
             (export_dir / "scripts").mkdir(exist_ok=True)
-            shutil.copy2(src, export_dir / "scripts" / ref)
+            _fast_copy(src, export_dir / "scripts" / ref)
 
     # Create manifest
     manifest = {
@@ -237,7 +292,7 @@ def import_skill(package_path, vault_root):
     dest_dir = skills_dir / skill_name
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest = dest_dir / "SKILL.md"
-    shutil.copy2(skill_file, dest)
+    _fast_copy(skill_file, dest)
     print(f"  Installed: {dest}")
 
     # Copy scripts
@@ -245,7 +300,7 @@ def import_skill(package_path, vault_root):
     if pkg_scripts.is_dir():
         for script in pkg_scripts.glob("*"):
             dest = scripts_dir / script.name
-            shutil.copy2(script, dest)
+            _fast_copy(script, dest)
             print(f"  Installed: {dest}")
 
     print(f"\nSkill imported. Update CLAUDE.md to reference the new skill.")
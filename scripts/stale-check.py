@@ -14,6 +14,7 @@ Dependencies: Python 3.9+ (stdlib only)
 
 import argparse
 import json
+import os
 import re
 import sys
 from datetime import datetime, timedelta
@@ -36,12 +37,20 @@ THRESHOLDS = {
 # Note types to prioritise
 HIGH_VALUE_TYPES = {"Decision", "Concept", "Pattern", "Note"}
 
-FM_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+# Characters read from the top of each note to find its frontmatter
+HEAD_CHARS = 8192
+
+# Frontmatter fields read by check_note, compiled once
+FIELD_PATTERNS = {
+    field: re.compile(rf"^{field}\s*:\s*(.+)$", re.MULTILINE)
+    for field in ("type", "title", "verified", "freshness", "classification")
+}
 
 
 def extract_field(yaml_text, field):
     """Extract a simple scalar field from YAML text."""
-    match = re.search(rf"^{field}\s*:\s*(.+)$", yaml_text, re.MULTILINE)
+    pattern = FIELD_PATTERNS.get(field) or re.compile(rf"^{field}\s*:\s*(.+)$", re.MULTILINE)
+    match = pattern.search(yaml_text)
     if match:
         value = match.group(1).strip().strip("'\"")
         if value in ("null", "~", ""):
@@ -50,8 +59,36 @@ def extract_field(yaml_text, field):
     return None
 
 
+def frontmatter_text(content):
+    """Return the YAML between a note's opening and closing --- lines.
+
+    Returns None without frontmatter. Either delimiter line may carry
+    trailing whitespace (so CRLF files work). Plain str.find scans replace
+    a lazy DOTALL regex, which is slow to fail on a note whose frontmatter
+    is never closed.
+    """
+    if not content.startswith("---"):
+        return None
+    start = content.find("\n") + 1
+    if not start or content[3:start].strip():
+        return None
+    end = content.find("\n---", start)
+    while end >= 0:
+        line_end = content.find("\n", end + 4)
+        if line_end < 0:
+            return None
+        if not content[end + 4:line_end].strip():
+            return content[start:end]
+        end = content.find("\n---", end + 1)
+    return None
+
+
 def find_vault_root():
     """Find the vault root."""
+    # MEKB_VAULT_ROOT names the vault explicitly
+    env = os.environ.get("MEKB_VAULT_ROOT")
+    if env:
+        return Path(env)
     path = Path.cwd()
     while path != path.parent:
         if (path / ".mekb").is_dir() or (path / "CLAUDE.md").is_file():
@@ -60,15 +97,32 @@ def find_vault_root():
     return Path.cwd()
 
 
-def should_skip(path, vault_root):
-    """Check if a path should be skipped."""
-    rel = path.relative_to(vault_root)
-    for part in rel.parts[:-1]:
-        if part in SKIP_DIRS:
-            return True
-    if path.suffix != ".md":
-        return True
-    return False
+def iter_notes(directory):
+    """Yield the .md files under directory, never entering SKIP_DIRS.
+
+    Skipped folders are pruned as they are reached rather than walked and
+    filtered afterwards, so .git, Archive and the like are never listed.
+    Files come before subfolders, each in directory order; symlinked
+    folders are not followed.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            if entry.name not in SKIP_DIRS:
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".md"):
+            yield Path(entry.path)
+    for subdir in subdirs:
+        yield from iter_notes(subdir)
 
 
 def parse_date(date_str):
@@ -83,16 +137,20 @@ def parse_date(date_str):
 
 def check_note(path, vault_root, today):
     """Check a single note for staleness."""
+    # Frontmatter sits at the top, so read only the first block of the
+    # note, and the rest only when its frontmatter runs past that
     try:
-        content = path.read_text(encoding="utf-8", errors="ignore")
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            head = f.read(HEAD_CHARS)
+            yaml_text = frontmatter_text(head)
+            if yaml_text is None and len(head) == HEAD_CHARS and head.startswith("---"):
+                yaml_text = frontmatter_text(head + f.read())
     except (IOError, OSError):
         return None
 
-    fm_match = FM_PATTERN.match(content)
-    if not fm_match:
+    if yaml_text is None:
         return None
 
-    yaml_text = fm_match.group(1)
     note_type = extract_field(yaml_text, "type")
     title = extract_field(yaml_text, "title") or path.stem
     verified = extract_field(yaml_text, "verified")
@@ -159,10 +217,7 @@ def main():
     stale_notes = {"critical": [], "high": [], "medium": []}
     total_checked = 0
 
-    for path in vault_root.rglob("*.md"):
-        if should_skip(path, vault_root):
-            continue
-
+    for path in iter_notes(vault_root):
         total_checked += 1
         result = check_note(path, vault_root, today)
         if result:
@@ -83,6 +83,46 @@ class TestEmbeddingsLoadExisting(unittest.TestCase):
             os.unlink(path)
 
 
+@unittest.skipUnless(_be.HAS_NUMPY, "numpy not installed")
+class TestEmbeddingsSave(unittest.TestCase):
+    """Test the float16 matrix storage."""
+
+    def setUp(self):
+        self.fixture = VaultFixture().setup()
+        self.path = self.fixture.root / ".mekb" / "embeddings.json"
+        _be.save_embeddings(self.path, {"model": "test-model", "dimension": 2, "embeddings": {
+            "a.md": {"title": "A", "mtime": 1.0, "vector": [0.5, -1.0]},
+            "b.md": {"title": "B", "mtime": 2.0, "vector": [2.0, 0.25]},
+        }})
+
+    def tearDown(self):
+        self.fixture.teardown()
+
+    def test_vectors_not_inline(self):
+        data = json.loads(self.path.read_text())
+        self.assertEqual(data["matrix"], "embeddings.npy")
+        self.assertEqual(data["embeddings"]["b.md"], {"title": "B", "mtime": 2.0, "row": 1})
+        matrix = _be.np.load(self.path.parent / "embeddings.npy")
+        self.assertEqual(matrix.dtype, _be.np.float16)
+        self.assertEqual(matrix.shape, (2, 2))
+
+    def test_rows_normalized(self):
+        self.assertTrue(json.loads(self.path.read_text())["normalized"])
+        matrix = _be.np.load(self.path.parent / "embeddings.npy").astype(_be.np.float32)
+        self.assertTrue(_be.np.allclose(_be.np.linalg.norm(matrix, axis=1), 1.0, atol=1e-3))
+
+    def test_load_existing_restores_vectors(self):
+        result = load_existing(self.path)
+        vector = result["embeddings"]["a.md"]["vector"].tolist()
+        self.assertAlmostEqual(vector[0], 0.5 / 1.25 ** 0.5, places=3)
+        self.assertAlmostEqual(vector[1], -1.0 / 1.25 ** 0.5, places=3)
+        self.assertNotIn("row", result["embeddings"]["a.md"])
+
+    def test_missing_matrix_drops_entries(self):
+        (self.path.parent / "embeddings.npy").unlink()
+        self.assertEqual(load_existing(self.path)["embeddings"], {})
+
+
 class TestEmbeddingsCollectNotes(unittest.TestCase):
     """Test note collection for embedding."""
 
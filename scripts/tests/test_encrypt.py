@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for encrypt.py - MeKB note encryption/decryption."""
 
+import contextlib
+import io
 import json
 import os
 import shutil
@@ -90,6 +92,19 @@ class TestSplitFrontmatter(unittest.TestCase):
         self.assertTrue(has_fm)
         self.assertIn('title: "Note: Special (chars) & more"', fm)
 
+    def test_crlf_and_blank_line_after_frontmatter(self):
+        content = "---\r\ntitle: Windows\r\n---\r\n\r\n# Body\r\n"
+        fm, body, has_fm = split_frontmatter(content)
+        self.assertTrue(has_fm)
+        self.assertEqual(fm, "---\r\ntitle: Windows\r\n---\r\n")
+        self.assertEqual(body, "\r\n# Body\r\n")
+
+    def test_unclosed_frontmatter(self):
+        content = "---\ntitle: Open\n----\n# Body\n"
+        fm, body, has_fm = split_frontmatter(content)
+        self.assertFalse(has_fm)
+        self.assertEqual(body, content)
+
 
 class TestParseFrontmatterFields(unittest.TestCase):
     """Test frontmatter field extraction."""
@@ -125,6 +140,13 @@ class TestParseFrontmatterFields(unittest.TestCase):
         fields = parse_frontmatter_fields("# Just text\n")
         self.assertEqual(fields, {})
 
+    def test_empty_value_does_not_borrow_next_line(self):
+        fm = "---\ntitle:\ntype: Note\nclassification: secret\nclassification: public\n---\n"
+        fields = parse_frontmatter_fields(fm)
+        self.assertIsNone(fields["title"])
+        self.assertEqual(fields["type"], "Note")
+        self.assertEqual(fields["classification"], "secret")
+
 
 class TestAddEncryptionFields(unittest.TestCase):
     """Test adding encryption metadata to frontmatter."""
@@ -215,6 +237,15 @@ class TestIsEncrypted(unittest.TestCase):
     def test_empty_content(self):
         self.assertFalse(is_encrypted(""))
 
+    def test_marker_deep_in_plaintext_body(self):
+        content = "---\ntitle: Docs\n---\n" + "text\n" * 5000 + f"{AGE_BEGIN}\n"
+        self.assertFalse(is_encrypted(content))
+
+    def test_long_frontmatter(self):
+        padding = "".join(f"field_{i}: {'x' * 60}\n" for i in range(200))
+        content = f"---\n{padding}---\n{AGE_BEGIN}\ndata\n{AGE_END}\n"
+        self.assertTrue(is_encrypted(content))
+
 
 @unittest.skipUnless(HAS_AGE, "age CLI not installed")
 class TestEncryptDecryptIntegration(unittest.TestCase):
@@ -365,6 +396,54 @@ class TestEncryptDecryptIntegration(unittest.TestCase):
         self.assertEqual(d1, body)
         self.assertEqual(d2, body)
 
+    def test_encrypt_many(self):
+        """Several files encrypt in one call; already-encrypted ones are skipped."""
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.tmpdir, f"Note - Batch {i}.md")
+            Path(path).write_text(f"---\ntitle: Batch {i}\n---\n# Body {i}\n")
+            paths.append(path)
+        skipped = os.path.join(self.tmpdir, "Note - Done.md")
+        Path(skipped).write_text(f"---\ntitle: Done\n---\n{AGE_BEGIN}\ndata\n{AGE_END}\n")
+        paths.append(skipped)
+
+        results = _enc.encrypt_many(paths, [self.public_key])
+        self.assertEqual(results, [(p, p != skipped) for p in paths])
+        for i, path in enumerate(paths[:3]):
+            self.assertIn(AGE_BEGIN, Path(path).read_text())
+            decrypt_file(path, self.identity_path)
+            self.assertIn(f"# Body {i}", Path(path).read_text())
+
+
+@unittest.skipUnless(_enc.HAS_PYRAGE, "pyrage not installed")
+class TestPyrageBackend(unittest.TestCase):
+    """In-process encryption via pyrage."""
+
+    def setUp(self):
+        import pyrage
+        self.tmpdir = tempfile.mkdtemp()
+        self.identity = pyrage.x25519.Identity.generate()
+        self.public_key = str(self.identity.to_public())
+        self.identity_path = os.path.join(self.tmpdir, "key.txt")
+        Path(self.identity_path).write_text(f"# public key: {self.public_key}\n{self.identity}\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    @patch.object(_enc, "check_age_installed", return_value=False)
+    def test_roundtrip_without_age_cli(self, _mock):
+        body = "# Notes\n\nUnicode: \u77e5\u8b58\n"
+        encrypted = encrypt_body(body, [self.public_key])
+        self.assertTrue(encrypted.startswith(AGE_BEGIN))
+        self.assertEqual(decrypt_body(encrypted, self.identity_path), body)
+
+    def test_wrong_identity_raises(self):
+        import pyrage
+        encrypted = encrypt_body("secret", [self.public_key])
+        Path(self.identity_path).write_text(f"{pyrage.x25519.Identity.generate()}\n")
+        with self.assertRaises(RuntimeError):
+            decrypt_body(encrypted, self.identity_path)
+
 
 class TestEncryptBodyErrors(unittest.TestCase):
     """Test error handling in encryption functions."""
@@ -383,6 +462,60 @@ class TestEncryptBodyErrors(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             decrypt_body("ciphertext", "/some/identity")
 
+    @patch.object(_enc, "age_path", return_value="/usr/bin/age")
+    @patch.object(_enc.subprocess, "run",
+                  return_value=subprocess.CompletedProcess([], 1, None, b"boom"))
+    def test_failed_encrypt_leaves_note_intact(self, _run, _age):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        path = Path(tmpdir) / "Note - Keep.md"
+        original = "---\ntitle: Keep\n---\n# Body\n"
+        path.write_text(original)
+        with self.assertRaises(RuntimeError):
+            encrypt_file(path, ["age1notparsedbypyrage"])
+        self.assertEqual(path.read_text(), original)
+        self.assertEqual(os.listdir(tmpdir), ["Note - Keep.md"])
+
+
+class TestEncryptManyFailures(unittest.TestCase):
+    """One failing file doesn't hide what happened to the others."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
+        self.paths = [os.path.join(self.tmpdir, f"Note - {name}.md") for name in "abc"]
+        for path in self.paths:
+            Path(path).write_text("---\ntitle: Batch\n---\n# Body\n")
+        os.unlink(self.paths[1])
+
+    @staticmethod
+    def _fake_encrypt(data, recipients, out=None):
+        out.write(AGE_BEGIN.encode() + b"\nfake\n" + AGE_END.encode() + b"\n")
+
+    def test_results_per_file(self):
+        with patch.object(_enc, "_encrypt_bytes", side_effect=self._fake_encrypt):
+            results = _enc.encrypt_many(self.paths, ["age1fake"])
+        self.assertEqual([p for p, _ in results], self.paths)
+        self.assertIs(results[0][1], True)
+        self.assertIsInstance(results[1][1], FileNotFoundError)
+        self.assertIs(results[2][1], True)
+        for path in (self.paths[0], self.paths[2]):
+            self.assertIn(AGE_BEGIN, Path(path).read_text())
+
+    def test_cli_reports_each_file_and_exits_nonzero(self):
+        out, err = io.StringIO(), io.StringIO()
+        argv = ["encrypt.py", "encrypt", *self.paths, "-r", "age1fake"]
+        with patch.object(_enc, "_encrypt_bytes", side_effect=self._fake_encrypt), \
+                patch.object(_enc, "check_age_installed", return_value=True), \
+                patch.object(_enc.sys, "argv", argv), \
+                contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            with self.assertRaises(SystemExit) as cm:
+                _enc.main()
+        self.assertEqual(cm.exception.code, 1)
+        self.assertEqual(out.getvalue().splitlines(),
+                         [f"Encrypted: {self.paths[0]}", f"Encrypted: {self.paths[2]}"])
+        self.assertIn(f"Failed: {self.paths[1]} - ", err.getvalue())
+
 
 class TestFileStatus(unittest.TestCase):
     """Test file status reporting."""
@@ -414,6 +547,32 @@ class TestFileStatus(unittest.TestCase):
         self.assertEqual(status["encryption_method"], "age")
         self.assertEqual(status["encryption_recipients"], 2)
 
+    def test_frontmatter_longer_than_head(self):
+        path = os.path.join(self.tmpdir, "Note - Long.md")
+        padding = "".join(f"field_{i}: {'x' * 60}\n" for i in range(200))
+        Path(path).write_text(f"---\ntitle: Long\n{padding}classification: secret\n---\n# Body\n")
+        status = file_status(path)
+        self.assertEqual(status["classification"], "secret")
+        self.assertFalse(status["encrypted"])
+
+
+class TestAuditStatus(unittest.TestCase):
+    """Test the audit's head-only classifier."""
+
+    def test_plaintext_default_classification(self):
+        self.assertEqual(_enc.audit_status(b"---\ntitle: A\n---\n# Body\n"), (False, "personal"))
+
+    def test_quoted_classification_and_marker(self):
+        head = f'---\nclassification: "secret"\n---\n{AGE_BEGIN}\n'.encode()
+        self.assertEqual(_enc.audit_status(head), (True, "secret"))
+
+    def test_body_field_ignored(self):
+        self.assertEqual(_enc.audit_status(b"# Note\nclassification: secret\n"), (False, "personal"))
+
+    def test_truncated_frontmatter_needs_full_read(self):
+        head = b"---\n" + b"x" * (_enc.HEAD_BYTES - 4)
+        self.assertIsNone(_enc.audit_status(head))
+
 
 class TestAuditVault(unittest.TestCase):
     """Test vault encryption audit."""
@@ -445,6 +604,21 @@ class TestAuditVault(unittest.TestCase):
         results = audit_vault(self.fixture.root)
         self.assertEqual(len(results["encrypted_correct"]), 1)
 
+    def test_warm_cache_skips_unchanged_notes(self):
+        path = create_note(
+            self.fixture.root, "Note - Cached.md",
+            frontmatter={"title": "Cached", "classification": "secret"},
+            body="# Secret",
+        )
+        audit_vault(self.fixture.root)
+        with patch.object(_enc, "_audit_status", side_effect=AssertionError("re-read")):
+            results = audit_vault(self.fixture.root)
+        self.assertEqual(len(results["unencrypted_classified"]), 1)
+
+        path.write_text("---\ntitle: Cached\nclassification: public\n---\n# Now public\n")
+        results = audit_vault(self.fixture.root)
+        self.assertEqual(results["unencrypted_classified"], [])
+
     def test_ignores_public_unencrypted(self):
         create_note(
             self.fixture.root, "Note - Public.md",
@@ -476,6 +650,17 @@ class TestAuditVault(unittest.TestCase):
         results = audit_vault(self.fixture.root)
         self.assertEqual(len(results["unencrypted_classified"]), 0)
 
+    def test_skips_nested_archive(self):
+        archive = self.fixture.root / "Projects" / "Archive"
+        archive.mkdir(parents=True)
+        create_note(
+            archive, "Old.md",
+            frontmatter={"title": "Old", "classification": "secret"},
+            body="# Old",
+        )
+        results = audit_vault(self.fixture.root)
+        self.assertEqual(results["unencrypted_classified"], [])
+
 
 class TestEncryptedOutputFormat(unittest.TestCase):
     """Test the split-format output spec."""
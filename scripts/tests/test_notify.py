@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Tests for notify.py."""
 
+import http.client
 import json
 import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, call
@@ -58,10 +60,36 @@ class TestLoadConfig(unittest.TestCase):
         config = load_config(self.fixture.root)
         self.assertIsNone(config["slack"]["webhook_url"])
 
+    def test_webhook_url_parsed_at_load(self):
+        config_path = self.fixture.root / ".mekb" / "notifications.yaml"
+        config_path.write_text("slack:\n  webhook_url: https://hooks.slack.com/services/T/B/x\n")
+        parsed = load_config(self.fixture.root)["slack"]["_parsed"]
+        self.assertEqual(parsed.netloc, "hooks.slack.com")
+        self.assertEqual(parsed.path, "/services/T/B/x")
+
+    def test_invalid_webhook_url_raises(self):
+        config_path = self.fixture.root / ".mekb" / "notifications.yaml"
+        config_path.write_text("discord:\n  webhook_url: discord.com/api/webhooks/secret\n")
+        with self.assertRaises(ValueError) as ctx:
+            load_config(self.fixture.root)
+        self.assertIn("discord.webhook_url", str(ctx.exception))
+        self.assertNotIn("secret", str(ctx.exception))
+
     def test_missing_file(self):
         config = load_config(self.fixture.root)
         self.assertEqual(config, {})
 
+    def test_cached_config_reread_after_edit(self):
+        config_path = self.fixture.root / ".mekb" / "notifications.yaml"
+        config_path.write_text("slack:\n  webhook_url: https://hooks.slack.com/a\n")
+        config = load_config(self.fixture.root)
+        config["slack"]["webhook_url"] = "changed"
+        self.assertEqual(load_config(self.fixture.root)["slack"]["webhook_url"],
+                         "https://hooks.slack.com/a")
+        config_path.write_text("slack:\n  webhook_url: https://hooks.slack.com/bb\n")
+        self.assertEqual(load_config(self.fixture.root)["slack"]["webhook_url"],
+                         "https://hooks.slack.com/bb")
+
 
 class TestDetectBackends(unittest.TestCase):
     """Test backend detection logic."""
@@ -126,50 +154,31 @@ class TestSendDesktop(unittest.TestCase):
 class TestSendSlack(unittest.TestCase):
     """Test Slack webhook sending."""
 
-    @patch("urllib.request.urlopen")
-    def test_success(self, mock_urlopen):
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.__enter__ = lambda s: mock_resp
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
-
+    @patch.object(_nt, "_post_json", return_value=200)
+    def test_success(self, mock_post):
         result = send_slack("Title", "Message", "https://hooks.slack.com/test")
         self.assertTrue(result)
         # Verify payload format
-        req = mock_urlopen.call_args[0][0]
-        payload = json.loads(req.data)
+        url, payload = mock_post.call_args[0]
+        self.assertEqual(url, "https://hooks.slack.com/test")
         self.assertIn("*Title*", payload["text"])
 
     def test_no_webhook_raises(self):
         with self.assertRaises(ValueError):
             send_slack("Title", "Message", None)
 
-    @patch("urllib.request.urlopen")
-    def test_payload_format(self, mock_urlopen):
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.__enter__ = lambda s: mock_resp
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
-
+    @patch.object(_nt, "_post_json", return_value=200)
+    def test_payload_format(self, mock_post):
         send_slack("Alert", "Something happened", "https://hooks.slack.com/x")
-        req = mock_urlopen.call_args[0][0]
-        payload = json.loads(req.data)
+        payload = mock_post.call_args[0][1]
         self.assertEqual(payload["text"], "*Alert*\nSomething happened")
 
 
 class TestSendDiscord(unittest.TestCase):
     """Test Discord webhook sending."""
 
-    @patch("urllib.request.urlopen")
-    def test_success(self, mock_urlopen):
-        mock_resp = MagicMock()
-        mock_resp.status = 204
-        mock_resp.__enter__ = lambda s: mock_resp
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
-
+    @patch.object(_nt, "_post_json", return_value=204)
+    def test_success(self, mock_post):
         result = send_discord("Title", "Message", "https://discord.com/api/webhooks/test")
         self.assertTrue(result)
 
@@ -178,19 +187,94 @@ class TestSendDiscord(unittest.TestCase):
             send_discord("Title", "Message", None)
 
 
+class TestPostJson(unittest.TestCase):
+    """Test webhook POSTs over kept-alive connections."""
+
+    def setUp(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import threading
+
+        test = self
+        self.connections = 0
+        self.bodies = []
+        self.status = 200
+        self.close_after = False
+        self.drop = False
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                test.connections += 1
+                super().setup()
+
+            def do_POST(self):
+                test.bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+                if test.drop:
+                    # Request received, connection closed before any response
+                    self.close_connection = True
+                    return
+                self.send_response(test.status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                self.close_connection = test.close_after
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(self._close_connections)
+        proxies = patch("urllib.request.getproxies", return_value={})
+        proxies.start()
+        self.addCleanup(proxies.stop)
+
+    def _close_connections(self):
+        for conn in _nt._http.__dict__.pop("conns", {}).values():
+            conn.close()
+
+    def test_reuses_connection(self):
+        self.assertEqual(_nt._post_json(self.url, {"n": 1}), 200)
+        self.assertEqual(_nt._post_json(self.url, {"n": 2}), 200)
+        self.assertEqual(self.connections, 1)
+        self.assertEqual([json.loads(b) for b in self.bodies], [{"n": 1}, {"n": 2}])
+
+    def test_reconnects_after_server_close(self):
+        self.close_after = True
+        _nt._post_json(self.url, {"n": 1})
+        time.sleep(0.1)  # the connection sits idle after the server closed it
+        self.assertEqual(_nt._post_json(self.url, {"n": 2}), 200)
+        self.assertEqual(len(self.bodies), 2)
+        self.assertEqual(self.connections, 2)
+
+    def test_no_resend_after_request_delivered(self):
+        self.drop = True
+        with self.assertRaises(http.client.RemoteDisconnected):
+            _nt._post_json(self.url, {"n": 1})
+        self.assertEqual(len(self.bodies), 1)
+
+    def test_error_status_raises(self):
+        import urllib.error
+        self.status = 500
+        with self.assertRaises(urllib.error.HTTPError):
+            _nt._post_json(self.url, {})
+
+
 class TestSendEmail(unittest.TestCase):
     """Test email sending via SMTP."""
 
+    def setUp(self):
+        self.addCleanup(_nt._smtp_sessions.clear)
+
     @patch("smtplib.SMTP")
     def test_success(self, mock_smtp_class):
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = lambda s: mock_smtp
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         config = {"smtp_host": "localhost", "smtp_port": "25", "to": "user@example.com"}
         result = send_email("Test", "Message", config)
         self.assertTrue(result)
-        mock_smtp.send_message.assert_called_once()
+        mock_smtp_class.return_value.send_message.assert_called_once()
 
     def test_no_to_address_raises(self):
         with self.assertRaises(ValueError):
@@ -198,14 +282,34 @@ class TestSendEmail(unittest.TestCase):
 
     @patch("smtplib.SMTP")
     def test_starttls_on_port_587(self, mock_smtp_class):
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__ = lambda s: mock_smtp
-        mock_smtp_class.return_value.__exit__ = MagicMock(return_value=False)
-
         config = {"smtp_host": "smtp.example.com", "smtp_port": "587",
                   "to": "user@example.com"}
         send_email("Test", "Message", config)
-        mock_smtp.starttls.assert_called_once()
+        mock_smtp_class.return_value.starttls.assert_called_once()
+
+    @patch("smtplib.SMTP")
+    def test_session_reused(self, mock_smtp_class):
+        server = mock_smtp_class.return_value
+        server.noop.return_value = (250, b"OK")
+        config = {"smtp_host": "smtp.example.com", "smtp_port": "587",
+                  "smtp_user": "me", "smtp_pass": "pw", "to": "user@example.com"}
+        send_email("One", "Message", config)
+        send_email("Two", "Message", config)
+        mock_smtp_class.assert_called_once()
+        server.login.assert_called_once()
+        self.assertEqual(server.send_message.call_count, 2)
+
+    @patch("smtplib.SMTP")
+    def test_dead_session_reconnects(self, mock_smtp_class):
+        import smtplib
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp_class.side_effect = [stale, fresh]
+        config = {"smtp_host": "localhost", "smtp_port": "25", "to": "user@example.com"}
+        send_email("One", "Message", config)
+        send_email("Two", "Message", config)
+        stale.close.assert_called_once()
+        fresh.send_message.assert_called_once()
 
 
 class TestSendNotification(unittest.TestCase):
@@ -218,14 +322,8 @@ class TestSendNotification(unittest.TestCase):
         result = send_notification("Test", "Message", config={})
         self.assertTrue(result)
 
-    @patch("urllib.request.urlopen")
-    def test_specific_backend(self, mock_urlopen):
-        mock_resp = MagicMock()
-        mock_resp.status = 200
-        mock_resp.__enter__ = lambda s: mock_resp
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
-
+    @patch.object(_nt, "_post_json", return_value=200)
+    def test_specific_backend(self, mock_post):
         config = {"slack": {"webhook_url": "https://hooks.slack.com/test"}}
         result = send_notification("Test", "Message", backend="slack", config=config)
         self.assertTrue(result)
@@ -240,5 +338,34 @@ class TestSendNotification(unittest.TestCase):
         self.assertFalse(result)
 
 
+class TestCmdTest(unittest.TestCase):
+    """Test the --test command."""
+
+    @patch("platform.system", return_value="Linux")
+    def test_backends_sent_concurrently(self, mock_sys):
+        import io
+        import threading
+        from contextlib import redirect_stdout
+
+        # Each wait returns only once both backends are sending at once
+        both_sending = threading.Barrier(2, timeout=5)
+
+        def slow(*args):
+            both_sending.wait()
+            return True
+
+        config = {"slack": {"webhook_url": "https://hooks.slack.com/test"},
+                  "discord": {"webhook_url": "https://discord.com/api/webhooks/test"},
+                  "email": {"to": "user@example.com"}}
+        out = io.StringIO()
+        with patch.object(_nt, "send_slack", side_effect=slow), \
+             patch.object(_nt, "send_discord", return_value=False), \
+             patch.object(_nt, "send_email", side_effect=slow), redirect_stdout(out):
+            _nt.cmd_test(config)
+        lines = [l.split() for l in out.getvalue().splitlines() if l.startswith("  ")]
+        self.assertEqual([l[0] for l in lines], ["Slack", "Discord", "Email"])
+        self.assertEqual([l[-1] for l in lines], ["OK", "FAILED", "OK"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for schedule.py."""
 
+import io
+import subprocess
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -45,6 +47,18 @@ class TestGeneratePlist(unittest.TestCase):
         self.assertIn("rebuild-index.log", plist)
         self.assertIn("rebuild-index.error.log", plist)
 
+    def test_script_arguments_are_separate_strings(self):
+        job = JOBS["stale-check"]
+        plist = generate_plist("stale-check", job, self.vault_root)
+        self.assertIn(f"<string>{self.vault_root}/scripts/stale-check.py</string>", plist)
+        self.assertIn("<string>--summary</string>", plist)
+
+    def test_paths_are_xml_escaped(self):
+        job = JOBS["rebuild-index"]
+        plist = generate_plist("rebuild-index", job, Path("/tmp/R&D <vault>"))
+        self.assertIn("<string>/tmp/R&amp;D &lt;vault&gt;</string>", plist)
+        self.assertNotIn("R&D", plist)
+
     def test_run_at_load_false(self):
         job = JOBS["rebuild-index"]
         plist = generate_plist("rebuild-index", job, self.vault_root)
@@ -85,6 +99,110 @@ class TestGenerateCrontab(unittest.TestCase):
         self.assertIn("* * 0", entry)
 
 
+class TestInstallMacos(unittest.TestCase):
+    """Test launchd installation."""
+
+    def setUp(self):
+        self.fixture = VaultFixture().setup()
+        self.agents_dir = self.fixture.root / "LaunchAgents"
+
+    def tearDown(self):
+        self.fixture.teardown()
+
+    def _install(self, returncode, jobs=None):
+        with patch.object(_sch, "get_launch_agents_dir", return_value=self.agents_dir), \
+             patch.object(_sch.subprocess, "run") as mock_run, \
+             patch("sys.stdout", new_callable=io.StringIO) as out:
+            mock_run.return_value = subprocess.CompletedProcess([], returncode, "", "boom")
+            _sch.install_macos(jobs, self.fixture.root)
+        return [c[0][0] for c in mock_run.call_args_list], out.getvalue()
+
+    def test_loads_all_jobs_in_one_call(self):
+        calls, out = self._install(0)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][:2], ["launchctl", "bootstrap"])
+        self.assertEqual(len(calls[0]) - 3, len(JOBS))
+        self.assertEqual(len(list(self.agents_dir.glob("com.mekb.*.plist"))), len(JOBS))
+        self.assertIn(f"{len(JOBS)} job(s) installed", out)
+
+    def test_reinstall_unloads_existing_in_one_call(self):
+        self._install(0)
+        calls, _ = self._install(0, ["rebuild-index"])
+        self.assertEqual([c[1] for c in calls], ["bootout", "bootstrap"])
+
+    def test_failed_load_reported(self):
+        calls, out = self._install(1, ["rebuild-index"])
+        self.assertEqual(calls[-1][1], "print")
+        self.assertIn("Failed: rebuild-index - boom", out)
+
+
+class TestInstallLinux(unittest.TestCase):
+    """Test crontab installation."""
+
+    def setUp(self):
+        self.fixture = VaultFixture().setup()
+
+    def tearDown(self):
+        self.fixture.teardown()
+
+    def _install(self, existing, jobs):
+        with patch.object(_sch.subprocess, "run") as mock_run, \
+             patch("sys.stdout", new_callable=io.StringIO):
+            mock_run.return_value = subprocess.CompletedProcess([], 0, existing, "")
+            _sch.install_linux(jobs, self.fixture.root)
+        self.assertEqual(mock_run.call_count, 2)
+        return mock_run.call_args_list[1][1]["input"].splitlines()
+
+    def test_partial_install_keeps_other_jobs(self):
+        user_line = "0 1 * * * backup.sh"
+        existing = "\n".join([
+            user_line,
+            generate_crontab_entry("rebuild-graph", JOBS["rebuild-graph"], self.fixture.root),
+            "0 0 * * * old-command # mekb:rebuild-index",
+        ]) + "\n"
+        lines = self._install(existing, ["rebuild-index", "stale-check"])
+        jobs = [_sch.cron_job_name(line) for line in lines]
+        self.assertEqual(jobs, [None, "rebuild-graph", "rebuild-index", "stale-check"])
+        self.assertEqual(lines[0], user_line)
+        self.assertNotIn("old-command", "\n".join(lines))
+
+    def test_full_install_replaces_all_mekb_entries(self):
+        existing = "0 0 * * * retired.sh # mekb:retired-job\n"
+        lines = self._install(existing, None)
+        self.assertEqual([_sch.cron_job_name(line) for line in lines], list(JOBS))
+
+
+class TestShowStatus(unittest.TestCase):
+    """Test launchd status reporting."""
+
+    def setUp(self):
+        self.fixture = VaultFixture().setup()
+        self.agents_dir = self.fixture.root / "LaunchAgents"
+        self.agents_dir.mkdir()
+
+    def tearDown(self):
+        self.fixture.teardown()
+
+    @patch("platform.system", return_value="Darwin")
+    def test_probes_only_installed_jobs(self, mock_sys):
+        for name in ("rebuild-index", "stale-check"):
+            (self.agents_dir / f"com.mekb.{name}.plist").write_text("")
+
+        def run(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, 0 if cmd[2].endswith("index") else 113)
+
+        with patch.object(_sch, "get_launch_agents_dir", return_value=self.agents_dir), \
+             patch.object(_sch.subprocess, "run", side_effect=run) as mock_run, \
+             patch("sys.stdout", new_callable=io.StringIO) as out:
+            _sch.show_status()
+        self.assertEqual(mock_run.call_count, 2)
+        lines = {line.split()[0]: line for line in out.getvalue().splitlines()
+                 if line.startswith("  ")}
+        self.assertRegex(lines["rebuild-index"], r"\s+loaded\s+daily")
+        self.assertIn("installed (not loaded)", lines["stale-check"])
+        self.assertIn("not installed", lines["rebuild-graph"])
+
+
 class TestJobDefinitions(unittest.TestCase):
     """Test job definition structure."""
 
@@ -4,8 +4,11 @@
 import json
 import os
 import sqlite3
+import struct
+import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 
@@ -152,6 +155,17 @@ Foo is a concept about bars.
         self.assertIn("notes", table_names)
         conn.close()
 
+    def test_create_schema_indexes(self):
+        conn = sqlite3.connect(str(self.db_path))
+        create_schema(conn)
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index'"
+        ).fetchall()}
+        self.assertIn("idx_notes_type", indexes)
+        self.assertIn("idx_notes_classification", indexes)
+        self.assertIn("idx_notes_path_mtime", indexes)
+        conn.close()
+
     def test_index_note(self):
         conn = sqlite3.connect(str(self.db_path))
         create_schema(conn)
@@ -187,6 +201,65 @@ Foo is a concept about bars.
         self.assertEqual(rows[0][0], "Test Note")
         conn.close()
 
+    def test_fts_survives_schema_reopen(self):
+        conn = sqlite3.connect(str(self.db_path))
+        self.assertFalse(create_schema(conn))
+        for path in self.vault_dir.glob("*.md"):
+            index_note(conn, path, self.vault_dir)
+        conn.commit()
+        conn.close()
+
+        # A second run must not drop the FTS rows index_note wrote
+        conn = sqlite3.connect(str(self.db_path))
+        self.assertFalse(create_schema(conn))
+        rows = conn.execute(
+            "SELECT rowid FROM fts_notes WHERE fts_notes MATCH 'testing'"
+        ).fetchall()
+        self.assertEqual(len(rows), 1)
+
+        # Losing the FTS table clears notes so every file is re-read
+        conn.execute("DROP TABLE fts_notes")
+        self.assertTrue(create_schema(conn))
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0], 0)
+        conn.close()
+
+    def test_fts_follows_updates_and_deletes(self):
+        conn = sqlite3.connect(str(self.db_path))
+        create_schema(conn)
+        path = self.vault_dir / "Note - Test.md"
+        index_note(conn, path, self.vault_dir)
+        conn.commit()
+
+        path.write_text("---\ntitle: Test Note\n---\n\nNow about gardening.\n")
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        self.assertTrue(index_note(conn, path, self.vault_dir))
+
+        def matches(term):
+            return conn.execute(
+                "SELECT COUNT(*) FROM fts_notes WHERE fts_notes MATCH ?", (term,)
+            ).fetchone()[0]
+
+        self.assertEqual(matches("testing"), 0)
+        self.assertEqual(matches("gardening"), 1)
+
+        removed = _bi.remove_deleted(conn, self.vault_dir, [])
+        self.assertEqual(removed, 1)
+        self.assertEqual(matches("gardening"), 0)
+        conn.close()
+
+    def test_oversized_body_truncated(self):
+        path = self.vault_dir / "Note - Huge.md"
+        path.write_text("---\ntitle: Huge\n---\n\n" + "x" * (_bi.MAX_INDEX_BYTES + 10))
+        conn = sqlite3.connect(str(self.db_path))
+        create_schema(conn)
+        self.assertTrue(index_note(conn, path, self.vault_dir))
+        content = conn.execute(
+            "SELECT content FROM fts_notes WHERE title = 'Huge'"
+        ).fetchone()[0]
+        self.assertTrue(content.endswith(_bi.TRUNCATED_MARKER))
+        self.assertLess(len(content), _bi.MAX_INDEX_BYTES + 20)
+        conn.close()
+
     def test_secret_notes_excluded(self):
         # Create a secret note
         (self.vault_dir / "Secret - Passwords.md").write_text("""---
@@ -219,6 +292,21 @@ Very secret content.
         self.assertFalse(result2)  # Should skip
         conn.close()
 
+    def test_prefetched_index(self):
+        conn = sqlite3.connect(str(self.db_path))
+        create_schema(conn)
+        notes = sorted(self.vault_dir.glob("*.md"))
+        stale = _bi.find_stale(conn, notes, self.vault_dir)
+        self.assertEqual(stale, notes)
+
+        contents = _bi.prefetch_notes(stale)
+        for path in stale:
+            self.assertTrue(index_note(conn, path, self.vault_dir, contents[path]))
+        conn.commit()
+
+        self.assertEqual(_bi.find_stale(conn, notes, self.vault_dir), [])
+        conn.close()
+
 
 class TestSearchEngine(unittest.TestCase):
     """Test search.py functions."""
@@ -249,6 +337,125 @@ class TestSearchEngine(unittest.TestCase):
         # Empty vectors
         self.assertEqual(_s.cosine_similarity([], []), 0.0)
 
+    def test_cosine_similarities_match_pairwise(self):
+        _s = _import_script("search", "search.py")
+        query = [0.5, -1.0, 2.0]
+        vectors = [[0.5, -1.0, 2.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [1.0, 2.0]]
+        batch = _s.cosine_similarities(query, vectors)
+        self.assertEqual(len(batch), len(vectors))
+        for got, vec in zip(batch, vectors):
+            self.assertAlmostEqual(got, _s.cosine_similarity(query, vec), places=5)
+
+
+class TestVectorSearch(unittest.TestCase):
+    """Test vector similarity search over embeddings.json."""
+
+    def setUp(self):
+        self._s = _import_script("search", "search.py")
+        self.fixture = VaultFixture().setup()
+        self.path = self.fixture.root / ".mekb" / "embeddings.json"
+        self.path.write_text(json.dumps({"model": "test-model", "dimension": 3, "embeddings": {
+            "Concept - Near.md": {"title": "Near", "type": "Concept", "vector": [1.0, 0.1, 0.0]},
+            "Concept - Far.md": {"title": "Far", "type": "Concept", "vector": [-1.0, 0.0, 0.0]},
+            "Concept - Mid.md": {"title": "Mid", "type": "Concept", "vector": [1.0, 1.0, 0.0]},
+            "Concept - Empty.md": {"title": "Empty", "vector": []},
+        }}))
+
+    def tearDown(self):
+        self.fixture.teardown()
+
+    def _search(self, limit):
+        from unittest.mock import patch
+        with patch.object(self._s, "compute_query_embedding", return_value=[2.0, 0.0, 0.0]):
+            return self._s.vector_search(self.path, "query", limit=limit)
+
+    def test_ranked_by_similarity(self):
+        results = self._search(10)
+        self.assertEqual([r["title"] for r in results], ["Near", "Mid", "Far"])
+        self.assertAlmostEqual(results[1]["vector_score"], 2 ** -0.5, places=5)
+        self.assertAlmostEqual(results[2]["vector_score"], -1.0, places=5)
+
+    def test_limit(self):
+        self.assertEqual([r["title"] for r in self._search(1)], ["Near"])
+
+    def test_matrix_file(self):
+        data = json.loads(self.path.read_text())
+        vectors = [e.pop("vector") for e in data["embeddings"].values()][:3]
+        for row, entry in enumerate(list(data["embeddings"].values())[:3]):
+            entry["row"] = row
+        data["matrix"] = "embeddings.npy"
+        self.path.write_text(json.dumps(data))
+        # A float16 .npy as numpy writes it: magic, version, header, rows
+        header = "{'descr': '<f2', 'fortran_order': False, 'shape': (3, 3), }"
+        header = header.ljust(117) + "\n"
+        values = struct.pack("<9e", *(v for vec in vectors for v in vec))
+        (self.path.parent / "embeddings.npy").write_bytes(
+            b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode() + values)
+
+        self.assertEqual([r["title"] for r in self._search(10)], ["Near", "Mid", "Far"])
+        from unittest.mock import patch
+        with patch.object(self._s, "HAS_NUMPY", False):
+            self._s.load_embeddings.cache_clear()
+            self.assertEqual([r["title"] for r in self._search(10)], ["Near", "Mid", "Far"])
+        self._s.load_embeddings.cache_clear()
+
+    def test_query_embedding_cached(self):
+        from unittest.mock import patch
+        with patch.object(self._s, "compute_query_embedding", return_value=[2.0, 0.0, 0.0]) as compute:
+            first = self._s.vector_search(self.path, "secret query", limit=10)
+            second = self._s.vector_search(self.path, "secret query", limit=10)
+        self.assertEqual(compute.call_count, 1)
+        self.assertEqual(first, second)
+        entries = list((self.fixture.root / ".mekb" / "query-cache").iterdir())
+        self.assertEqual(len(entries), 1)
+        self.assertNotIn("secret", entries[0].read_text())
+
+
+class TestFindVaultRoot(unittest.TestCase):
+    """Test vault discovery."""
+
+    def setUp(self):
+        self._s = _import_script("search", "search.py")
+        self.fixture = VaultFixture().setup()
+
+    def tearDown(self):
+        self.fixture.teardown()
+
+    def test_env_var_overrides_search(self):
+        from unittest.mock import patch
+        with patch.dict(os.environ, {"MEKB_VAULT_ROOT": str(self.fixture.root)}):
+            self.assertEqual(self._s.find_vault_root(), self.fixture.root)
+
+    def test_finds_marker_from_subdirectory(self):
+        from unittest.mock import patch
+        sub = self.fixture.root / "Notes" / "Deep"
+        sub.mkdir(parents=True)
+        env = {k: v for k, v in os.environ.items() if k != "MEKB_VAULT_ROOT"}
+        with patch.dict(os.environ, env, clear=True), patch.object(Path, "cwd", return_value=sub):
+            self.assertEqual(self._s.find_vault_root(), self.fixture.root)
+
+
+class TestLoadGraphDegrees(unittest.TestCase):
+    """Test graph centrality loading."""
+
+    def setUp(self):
+        self._s = _import_script("search", "search.py")
+        self.fixture = VaultFixture().setup()
+        self.path = self.fixture.root / ".mekb" / "graph.json"
+
+    def tearDown(self):
+        self.fixture.teardown()
+
+    def test_normalised_degrees(self):
+        self.path.write_text(json.dumps({"nodes": {
+            "Concept - Hub.md": {"degree": 4}, "Concept - Leaf.md": {"degree": 1}}}))
+        self.assertEqual(self._s.load_graph_degrees(self.fixture.root),
+                         {"Concept - Hub.md": 1.0, "Concept - Leaf.md": 0.25})
+
+    def test_corrupt_file(self):
+        self.path.write_text("{not valid json")
+        self.assertEqual(self._s.load_graph_degrees(self.fixture.root), {})
+
 
 class TestSearchHybrid(unittest.TestCase):
     """Test hybrid search fusion."""
@@ -282,6 +489,11 @@ class TestSearchHybrid(unittest.TestCase):
         self.assertEqual(len(paths), 2)
         self.assertEqual(paths[0], "Concept - A.md")
 
+    def test_limit(self):
+        ranked = [r["path"] for r in self.hybrid_search(self.fts_results, self.vec_results)]
+        top = self.hybrid_search(self.fts_results, self.vec_results, limit=2)
+        self.assertEqual([r["path"] for r in top], ranked[:2])
+
     def test_graph_boost(self):
         degrees = {"Concept - B.md": 1.0, "Concept - A.md": 0.1, "Concept - C.md": 0.5}
         results_with = self.hybrid_search(self.fts_results, self.vec_results, graph_degrees=degrees)
@@ -341,6 +553,38 @@ class TestSearchFiltering(unittest.TestCase):
         paths = [r["path"] for r in results]
         self.assertNotIn("Note - Secret.md", paths)
 
+    def _build_index(self, *args):
+        """Run build-index.py in its own process, as the CLI would be."""
+        return subprocess.run(
+            [sys.executable, str(SCRIPTS_DIR / "build-index.py"),
+             "--vault", str(self.fixture.root), *args],
+            capture_output=True, text=True)
+
+    def test_connection_reused_until_rebuilt(self):
+        self.db_path.unlink()
+        self.assertEqual(self._build_index().returncode, 0)
+        self.assertEqual(len(self._search.fts5_search(self.db_path, "testing")), 2)
+        conn = self._search.open_index(self.db_path)
+        self.assertIs(self._search.open_index(self.db_path), conn)
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM notes")
+
+        # An incremental build gets a fresh connection on the next search
+        create_note(self.fixture.root, "Concept - Gamma.md",
+                     {"type": "Concept", "title": "Gamma"},
+                     "Gamma is more testing.")
+        self.assertEqual(self._build_index().returncode, 0)
+        self.assertEqual(len(self._search.fts5_search(self.db_path, "testing")), 3)
+        conn = self._search.open_index(self.db_path)
+
+        # Rebuild while this process still has the WAL-mode index open
+        (self.fixture.root / "Pattern - Beta.md").unlink()
+        result = self._build_index("--rebuild")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIsNot(self._search.open_index(self.db_path), conn)
+        paths = {r["path"] for r in self._search.fts5_search(self.db_path, "testing")}
+        self.assertEqual(paths, {"Concept - Alpha.md", "Concept - Gamma.md"})
+
     def test_special_chars_in_query(self):
         result = self._search.sanitise_fts_query("test{brackets}")
         self.assertNotIn("{", result)
@@ -380,6 +624,16 @@ class TestBuildIndexCollect(unittest.TestCase):
         _bi_local = _import_script("build_index", "build-index.py")
         self.assertTrue(_bi_local.should_skip(note, self.fixture.root))
 
+    def test_should_skip_nested_skip_dir(self):
+        nested = self.fixture.root / "Projects" / "secret"
+        nested.mkdir(parents=True)
+        note = nested / "Creds.md"
+        note.write_text("password")
+        _bi_local = _import_script("build_index", "build-index.py")
+        self.assertTrue(_bi_local.should_skip(note, self.fixture.root))
+        self.assertFalse(_bi_local.should_skip(
+            self.fixture.root / "Projects" / "Plan.md", self.fixture.root))
+
     def test_should_skip_non_md(self):
         py_file = self.fixture.root / "script.py"
         py_file.write_text("print('hi')")
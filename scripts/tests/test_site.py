@@ -53,6 +53,13 @@ class TestSiteFrontmatter(unittest.TestCase):
         meta, body = parse_frontmatter(content)
         self.assertEqual(meta["tags"], ["domain/data", "activity/research"])
 
+    def test_dashes_inside_value(self):
+        content = "---\ntitle: Before---After\ntype: Concept\n---\nBody"
+        meta, body = parse_frontmatter(content)
+        self.assertEqual(meta["title"], "Before---After")
+        self.assertEqual(meta["type"], "Concept")
+        self.assertEqual(body, "Body")
+
 
 class TestMarkdownToHtml(unittest.TestCase):
     """Test markdown to HTML conversion."""
@@ -151,6 +158,14 @@ class TestInlineMarkdown(unittest.TestCase):
         self.assertIn("<strong>bold</strong>", result)
         self.assertIn("<code>code</code>", result)
 
+    def test_code_span_is_literal(self):
+        result = _inline_md("Write `[[Note]] and **x**` here", {"Note": "note.html"})
+        self.assertIn("<code>[[Note]] and **x**</code>", result)
+
+    def test_nested_formatting_in_link(self):
+        result = _inline_md("[**Docs**](https://example.com)")
+        self.assertIn('<a href="https://example.com"><strong>Docs</strong></a>', result)
+
 
 class TestSiteNoteCollection(unittest.TestCase):
     """Test note collection for site building."""
@@ -250,6 +265,55 @@ class TestSiteBuilder(unittest.TestCase):
         # At least index + notes + tags + 2 note pages
         self.assertGreaterEqual(len(html_files), 5)
 
+    def _age_pages(self):
+        for page in self.output_dir.glob("*.html"):
+            os.utime(page, (1, 1))
+
+    def test_incremental_skips_unchanged(self):
+        build_site(self.fixture.root, self.output_dir)
+        self._age_pages()
+        build_site(self.fixture.root, self.output_dir)
+        self.assertEqual((self.output_dir / "concept---alpha.html").stat().st_mtime, 1)
+
+        create_note(self.fixture.root, "Concept - Alpha.md",
+                     {"type": "Concept", "title": "Alpha"}, "Changed body.")
+        build_site(self.fixture.root, self.output_dir)
+        page = self.output_dir / "concept---alpha.html"
+        self.assertNotEqual(page.stat().st_mtime, 1)
+        self.assertIn("Changed body.", page.read_text())
+        self.assertEqual((self.output_dir / "pattern---beta.html").stat().st_mtime, 1)
+
+    def test_incremental_follows_link_targets(self):
+        create_note(self.fixture.root, "Note - Linker.md",
+                     {"type": "Note", "title": "Linker"}, "See [[Gamma]].")
+        build_site(self.fixture.root, self.output_dir)
+        self.assertIn('<span class="wiki-link broken">', (self.output_dir / "note---linker.html").read_text())
+
+        create_note(self.fixture.root, "Concept - Gamma.md",
+                     {"type": "Concept", "title": "Gamma"}, "Gamma.")
+        build_site(self.fixture.root, self.output_dir)
+        self.assertIn('href="concept---gamma.html"', (self.output_dir / "note---linker.html").read_text())
+
+    def test_incremental_removes_deleted_pages(self):
+        build_site(self.fixture.root, self.output_dir)
+        (self.fixture.root / "Pattern - Beta.md").unlink()
+        build_site(self.fixture.root, self.output_dir)
+        self.assertFalse((self.output_dir / "pattern---beta.html").exists())
+
+    def test_force_rebuilds_everything(self):
+        build_site(self.fixture.root, self.output_dir)
+        self._age_pages()
+        build_site(self.fixture.root, self.output_dir, force=True)
+        self.assertNotEqual((self.output_dir / "pattern---beta.html").stat().st_mtime, 1)
+
+    def test_rebuild_keeps_unmanaged_files(self):
+        build_site(self.fixture.root, self.output_dir)
+        (self.output_dir / "CNAME").write_text("notes.example.org\n")
+        (self.fixture.root / "Pattern - Beta.md").unlink()
+        build_site(self.fixture.root, self.output_dir, force=True)
+        self.assertTrue((self.output_dir / "CNAME").exists())
+        self.assertFalse((self.output_dir / "pattern---beta.html").exists())
+
     def test_dry_run_creates_nothing(self):
         clean_dir = Path(tempfile.mkdtemp())
         try:
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for skill-tools.py."""
 
+import contextlib
+import io
 import os
 import shutil
 import tempfile
@@ -127,6 +129,44 @@ class TestValidateSkill(unittest.TestCase):
         issues = validate_skill(path, self.fixture.root)
         self.assertTrue(any("not found" in i.lower() for i in issues))
 
+    def test_validate_all_reports_in_order(self):
+        for name in ("zeta", "alpha", "mid"):
+            self._write_skill(name, f"# /{name}\n\n## Usage\n\n## Instructions\n")
+        self._write_skill("beta", "No header here\n")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            total = _st.validate_all(self.fixture.root, verbose=True)
+        self.assertEqual(total, 3)
+        lines = [line.strip() for line in out.getvalue().splitlines() if line.strip()]
+        self.assertEqual(lines[1:5], ["OK: SKILL.md", "beta/SKILL.md:",
+                                      "- Missing command header (expected '# /name')",
+                                      "- Missing '## Usage' or '## When to Use' section"])
+        self.assertEqual(lines.count("OK: SKILL.md"), 3)
+
+
+class TestFastCopy(unittest.TestCase):
+    """Test the copy helper used by export and import."""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.src = self.tmp / "SKILL.md"
+        self.src.write_text("# /demo\n")
+        os.utime(self.src, (1000000000, 1000000000))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_copies_content_and_mtime(self):
+        dst = self.tmp / "copy.md"
+        _st._fast_copy(self.src, dst)
+        self.assertEqual(dst.read_text(), "# /demo\n")
+        self.assertEqual(dst.stat().st_mtime, 1000000000)
+
+    def test_same_file_left_intact(self):
+        with self.assertRaises(shutil.SameFileError):
+            _st._fast_copy(self.src, self.src)
+        self.assertEqual(self.src.read_text(), "# /demo\n")
+
 
 if __name__ == "__main__":
     unittest.main()
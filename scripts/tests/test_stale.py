@@ -11,7 +11,8 @@ from helpers import _import_script, create_note, VaultFixture, SCRIPTS_DIR
 
 _sc = _import_script("stale_check", "stale-check.py")
 parse_date = _sc.parse_date
-should_skip = _sc.should_skip
+iter_notes = _sc.iter_notes
+frontmatter_text = _sc.frontmatter_text
 check_note = _sc.check_note
 THRESHOLDS = _sc.THRESHOLDS
 
@@ -39,8 +40,27 @@ class TestStaleDateParsing(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestFrontmatterText(unittest.TestCase):
+    """Test frontmatter extraction."""
+
+    def test_lf(self):
+        self.assertEqual(frontmatter_text("---\ntype: Concept\n---\nBody\n"), "type: Concept")
+
+    def test_crlf_and_trailing_space(self):
+        text = frontmatter_text("--- \r\ntype: Concept\r\n---\t\r\nBody\r\n")
+        self.assertEqual(text, "type: Concept\r")
+
+    def test_dashes_inside_value_not_delimiter(self):
+        text = frontmatter_text("---\ntitle: x\n----\ntype: Concept\n---\n")
+        self.assertEqual(text, "title: x\n----\ntype: Concept")
+
+    def test_missing(self):
+        self.assertIsNone(frontmatter_text("# Heading\n---\n"))
+        self.assertIsNone(frontmatter_text("---\ntype: Concept\n" + "Body\n" * 1000))
+
+
 class TestStaleSkipLogic(unittest.TestCase):
-    """Test file skip logic."""
+    """Test which files the vault walk yields."""
 
     def setUp(self):
         self.fixture = VaultFixture().setup()
@@ -48,24 +68,35 @@ class TestStaleSkipLogic(unittest.TestCase):
     def tearDown(self):
         self.fixture.teardown()
 
+    def _names(self):
+        return [p.name for p in iter_notes(self.fixture.root)]
+
     def test_archive_dir_skipped(self):
         archive_dir = self.fixture.root / "Archive"
         archive_dir.mkdir()
         note = archive_dir / "Old Note.md"
         note.write_text("content")
-        self.assertTrue(should_skip(note, self.fixture.root))
+        self.assertNotIn("Old Note.md", self._names())
 
     def test_secret_dir_skipped(self):
-        secret_dir = self.fixture.root / "secret"
-        secret_dir.mkdir()
+        secret_dir = self.fixture.root / "secret" / "nested"
+        secret_dir.mkdir(parents=True)
         note = secret_dir / "Creds.md"
         note.write_text("content")
-        self.assertTrue(should_skip(note, self.fixture.root))
+        self.assertNotIn("Creds.md", self._names())
 
     def test_root_md_not_skipped(self):
-        note = create_note(self.fixture.root, "Note - Test.md",
-                           {"type": "Note", "title": "Test"}, "Content")
-        self.assertFalse(should_skip(note, self.fixture.root))
+        create_note(self.fixture.root, "Note - Test.md",
+                    {"type": "Note", "title": "Test"}, "Content")
+        (self.fixture.root / "image.png").write_text("binary")
+        self.assertEqual(sorted(self._names()), ["CLAUDE.md", "Note - Test.md"])
+
+    def test_nested_folders_walked(self):
+        folder = self.fixture.root / "Projects" / "Alpha"
+        folder.mkdir(parents=True)
+        create_note(folder, "Concept - Deep.md", {"type": "Concept"}, "Content")
+        self.assertIn(Path("Projects/Alpha/Concept - Deep.md"),
+                      [p.relative_to(self.fixture.root) for p in iter_notes(self.fixture.root)])
 
 
 class TestCheckNote(unittest.TestCase):
@@ -148,6 +179,16 @@ class TestCheckNote(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result["priority"], "critical")
 
+    def test_long_frontmatter_read_in_full(self):
+        """Frontmatter longer than the first read is still found."""
+        old_date = (self.today - timedelta(days=200)).strftime("%Y-%m-%d")
+        note = create_note(self.fixture.root, "Concept - Long.md",
+                           {"type": "Concept", "summary": "x" * (2 * _sc.HEAD_CHARS),
+                            "verified": old_date}, "Content")
+        result = check_note(note, self.fixture.root, self.today)
+        self.assertIsNotNone(result)
+        self.assertEqual(result["verified"], old_date)
+
     def test_high_value_type_boost(self):
         """High-value types at medium staleness should be boosted to high."""
         old_date = (self.today - timedelta(days=100)).strftime("%Y-%m-%d")